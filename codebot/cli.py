@@ -1,25 +1,83 @@
 """CLI interface for codebot."""
 
+import importlib
+import sys
+from typing import Optional
+
 import click
-from dotenv import load_dotenv
 
-from codebot.cli_runner.runner import run
-from codebot.server.app import serve
+from codebot import __version__
 
 
-@click.group()
-def cli():
-    """Codebot CLI - AI-assisted development task automation."""
-    load_dotenv()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are invoked."""
+    
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[dict] = None,
+        lazy_short_help: Optional[dict] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the lazy group.
+    
+        Args:
+            lazy_subcommands: Mapping of command name to "module.path:attribute"
+            lazy_short_help: Mapping of command name to the one-line help shown in
+                the group's --help, so listing commands does not import them
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_short_help = lazy_short_help or {}
+    
+    def list_commands(self, ctx: click.Context) -> list:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+    
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name)
+            return getattr(module, attr_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        rows = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_short_help:
+                rows.append((cmd_name, self.lazy_short_help[cmd_name]))
+                continue
+            cmd = self.get_command(ctx, cmd_name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((cmd_name, cmd.get_short_help_str(formatter.width - 6 - len(cmd_name))))
+        
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
 
-# Register commands
-cli.add_command(run)
-cli.add_command(serve)
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "run": "codebot.cli_runner.runner:run",
+        "serve": "codebot.server.app:serve",
+    },
+    lazy_short_help={
+        "run": "Run a development task and open a pull request.",
+        "serve": "Start the webhook server, task API and web interface.",
+    },
+)
+@click.version_option(__version__, "-V", "--version", prog_name="codebot")
+def cli():
+    """Codebot CLI - AI-assisted development task automation."""
 
 
 def main():
     """Entry point for the CLI."""
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        print(f"codebot, version {__version__}")
+        return
     cli()
 
 
@@ -3,18 +3,11 @@
 import os
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
-
-from codebot.core.github_app import GitHubAppAuth
-from codebot.core.models import Task
-from codebot.core.orchestrator import Orchestrator
-from codebot.core.parser import parse_task_prompt, parse_task_prompt_file
-from codebot.core.task_store import global_task_store
-from codebot.core.utils import validate_github_app_config
 
 
 @click.command(name="run")
@@ -46,7 +39,7 @@ def run(
     verbose: bool,
 ) -> None:
     """
-    Codebot CLI - AI-assisted development task automation.
+    Run a development task and open a pull request.
     
     This tool accepts task prompts, clones repositories, runs Claude Code CLI,
     and creates GitHub pull requests.
@@ -62,7 +55,15 @@ def run(
           Fix the login authentication bug.
           Ensure all tests pass.
     """
-    load_dotenv()
+    # Import here so that --help and argument errors don't load the orchestrator stack
+    from codebot.core.github_app import GitHubAppAuth
+    from codebot.core.models import Task
+    from codebot.core.parser import parse_task_prompt, parse_task_prompt_file
+    from codebot.core.task_store import global_task_store
+    from codebot.core.utils import configure_logging, load_dotenv_once, validate_github_app_config_cached
+    
+    load_dotenv_once()
+    configure_logging(verbose)
     
     try:
         if task_prompt:
@@ -81,8 +82,6 @@ def run(
     else:
         work_base_dir = Path.cwd() / "codebot_workspace"
     
-    work_base_dir.mkdir(parents=True, exist_ok=True)
-    
     print("Validating GitHub App configuration...")
     if verbose:
         print("Debug information:")
@@ -96,7 +95,18 @@ def run(
             print("  → No GitHub Enterprise environment variables set, using github.com")
         print(f"  → Repository URL from task: {task.repository_url}")
     
-    is_valid, error_type = validate_github_app_config(repository_url=task.repository_url, verbose=verbose)
+    # Validation is a network round-trip, so overlap it with local setup
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        validation = executor.submit(
+            validate_github_app_config_cached, repository_url=task.repository_url, verbose=verbose
+        )
+        
+        work_base_dir.mkdir(parents=True, exist_ok=True)
+        
+        from codebot.core.orchestrator import Orchestrator
+        
+        is_valid, error_type = validation.result()
+    
     if not is_valid:
         if error_type == "config_missing":
             click.echo("Error: GitHub App configuration not found. Please set the required environment variables.", err=True)
@@ -104,6 +114,7 @@ def run(
             click.echo("  - GITHUB_APP_ID", err=True)
             click.echo("  - GITHUB_APP_PRIVATE_KEY_PATH", err=True)
             click.echo("  - GITHUB_APP_INSTALLATION_ID", err=True)
+            click.echo("  - GITHUB_BOT_NAME", err=True)
         elif error_type == "installation_not_found":
             click.echo("Error: GitHub App installation not found (404).", err=True)
             click.echo("This usually means:", err=True)
@@ -1,9 +1,11 @@
 """Environment manager for isolated development environments."""
 
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from codebot.core.github_app import GitHubAppAuth
 from codebot.core.git_ops import GitOps
 from codebot.core.models import TaskPrompt
 from codebot.core.utils import (
@@ -12,11 +14,16 @@ from codebot.core.utils import (
     generate_short_uuid
 )
 
+if TYPE_CHECKING:
+    from codebot.core.github_app import GitHubAppAuth
+
+_LOG = logging.getLogger(__name__)
+
 
 class EnvironmentManager:
     """Manages isolated development environments for codebot tasks."""
     
-    def __init__(self, base_dir: Path, task: TaskPrompt, github_app_auth: Optional[GitHubAppAuth] = None):
+    def __init__(self, base_dir: Path, task: TaskPrompt, github_app_auth: Optional["GitHubAppAuth"] = None):
         """
         Initialize the environment manager.
         
@@ -44,16 +51,22 @@ class EnvironmentManager:
         
         dir_name = generate_directory_name(self.task.ticket_id, uuid_part)
         self.work_dir = self.base_dir / dir_name
-        self.work_dir.mkdir(parents=True, exist_ok=True)
+        # The base directory usually exists already, so try the single mkdir first
+        try:
+            os.mkdir(self.work_dir)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            self.work_dir.mkdir(parents=True, exist_ok=True)
         
-        print(f"Created work directory: {self.work_dir}")
+        _LOG.info("Created work directory: %s", self.work_dir)
         
         GitOps.clone_repository(self.task.repository_url, self.work_dir, self.github_app_auth)
         
         self.git_ops.configure_git_author()
         
         self.default_branch = self.git_ops.detect_default_branch()
-        print(f"Detected default branch: {self.default_branch}")
+        _LOG.info("Detected default branch: %s", self.default_branch)
         
         base_branch = self.task.base_branch or self.default_branch
         self.git_ops.checkout_branch(base_branch)
@@ -63,7 +76,7 @@ class EnvironmentManager:
             short_name=self.task.ticket_summary,
             uuid_part=uuid_part,
         )
-        print(f"Creating branch: {self.branch_name}")
+        _LOG.info("Creating branch: %s", self.branch_name)
         self.git_ops.create_branch(self.branch_name)
         
         return self.work_dir
@@ -84,8 +97,8 @@ class EnvironmentManager:
         self.branch_name = branch_name
         self.task.repository_url = repo_url
         
-        print(f"Reusing workspace: {self.work_dir}")
-        print(f"Updating branch: {branch_name}")
+        _LOG.info("Reusing workspace: %s", self.work_dir)
+        _LOG.info("Updating branch: %s", branch_name)
         
         self._git_ops = None
         
@@ -109,13 +122,18 @@ class EnvironmentManager:
         if not self.work_dir:
             return
         
-        if not self.git_ops.fetch_from_remote():
-            return
+        # The fetch is network-bound, so check the local branch while it runs
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetch_future = executor.submit(self.git_ops.fetch_from_remote)
+            current_branch = self.git_ops.get_current_branch()
+            if not fetch_future.result():
+                return
         
-        print(f"Checking out branch: {self.branch_name}")
-        self.git_ops.checkout_branch(self.branch_name)
+        if current_branch != self.branch_name:
+            _LOG.info("Checking out branch: %s", self.branch_name)
+            self.git_ops.checkout_branch(self.branch_name)
         
         self.git_ops.pull_latest_changes(self.branch_name)
         
-        print("Workspace updated successfully")
+        _LOG.info("Workspace updated successfully")
     
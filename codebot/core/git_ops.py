@@ -1,18 +1,38 @@
 """Git operations for committing and pushing changes."""
 
+import base64
+import logging
+import re
+import shutil
 import subprocess
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from urllib.parse import urlparse
 
-from codebot.core.github_app import GitHubAppAuth
 from codebot.core.utils import get_codebot_git_author_info, get_git_env, is_github_url
 
+if TYPE_CHECKING:
+    from codebot.core.github_app import GitHubAppAuth
+
+_LOG = logging.getLogger(__name__)
+
+# Resolved once so that each git call skips the PATH search
+_GIT = shutil.which("git") or "git"
+# Git calls pass close_fds=False: Python creates descriptors non-inheritable
+# (PEP 446), so the child gains nothing from the per-spawn descriptor sweep.
+
+_OBJECT_ID_RE = re.compile(r"[0-9a-f]{40}([0-9a-f]{24})?")
+
+_CO_AUTHOR_MARKER = "Co-Authored-By:"
+_GENERATED_MARKER = "🤖 Generated with Claude Code"
+_UNWANTED_COMMIT_LINE_RE = re.compile(rf"^\s*{re.escape(_CO_AUTHOR_MARKER)}|{re.escape(_GENERATED_MARKER)}")
+
 
 class GitOps:
     """Git operations for codebot."""
     
-    def __init__(self, work_dir: Path, github_app_auth: Optional[GitHubAppAuth] = None):
+    def __init__(self, work_dir: Path, github_app_auth: Optional["GitHubAppAuth"] = None):
         """
         Initialize git operations.
         
@@ -22,8 +42,128 @@ class GitOps:
         """
         self.work_dir = work_dir
         self.github_app_auth = github_app_auth
+        self._env: Optional[dict] = None
+        self._msg_cache: dict = {}
+        self._default_branch: Optional[str] = None
+        self._batch_proc: Optional[subprocess.Popen] = None
+        self._batch_lock = threading.Lock()
+    
+    def __del__(self):
+        self.close()
+    
+    def close(self) -> None:
+        """Stop the persistent git cat-file process, if one was started."""
+        proc = getattr(self, "_batch_proc", None)
+        if proc is None:
+            return
+        self._batch_proc = None
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+    
+    def _ensure_batch(self) -> subprocess.Popen:
+        """Start (or reuse) a long-lived `git cat-file --batch` process for object reads."""
+        if self._batch_proc is None or self._batch_proc.poll() is not None:
+            self._batch_proc = subprocess.Popen(
+                [_GIT, "cat-file", "--batch"],
+                cwd=self.work_dir,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self._get_git_env(),
+                close_fds=False,
+            )
+        return self._batch_proc
+    
+    def _read_object(self, rev: str) -> Optional[bytes]:
+        """
+        Read a git object through the persistent cat-file process.
+        
+        Args:
+            rev: Object name or revision to read
+            
+        Returns:
+            Raw object contents, or None if the object does not exist
+        """
+        with self._batch_lock:
+            proc = self._ensure_batch()
+            proc.stdin.write(rev.encode() + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            if not header:
+                raise OSError("git cat-file exited unexpectedly")
+            fields = header.split()
+            if len(fields) != 3:
+                return None
+            size = int(fields[2])
+            data = proc.stdout.read(size + 1)
+            return data[:size]
+    
+    def _read_commit_message(self, rev: str) -> Optional[str]:
+        """
+        Read the raw message of a commit through the persistent cat-file process.
+        
+        Args:
+            rev: Commit hash or revision
+            
+        Returns:
+            Unstripped commit message, or None if the cat-file process is unusable
+            and the caller should fall back to git log
+        """
+        if not rev or "\n" in rev:
+            return None
+        
+        try:
+            commit = self._read_object(rev)
+        except (OSError, ValueError):
+            self.close()
+            return None
+        
+        if commit is None:
+            raise RuntimeError(f"Failed to get commit message: commit {rev} not found")
+        
+        _, _, message = commit.partition(b"\n\n")
+        return message.decode("utf-8", "replace")
+    
+    def _read_git_file(self, relative_path: str) -> Optional[str]:
+        try:
+            return (self.work_dir / ".git" / relative_path).read_text().strip()
+        except OSError:
+            return None
+    
+    def _resolve_ref(self, ref: str) -> Optional[str]:
+        """
+        Resolve a ref to an object ID from the loose ref file or packed-refs.
+        
+        Args:
+            ref: Full ref name (e.g., "refs/heads/main")
+            
+        Returns:
+            Object ID or None if the ref could not be found
+        """
+        object_id = self._read_git_file(ref)
+        if object_id and _OBJECT_ID_RE.fullmatch(object_id):
+            return object_id
+        
+        packed_refs = self._read_git_file("packed-refs")
+        if packed_refs:
+            suffix = f" {ref}"
+            for line in packed_refs.splitlines():
+                if line.endswith(suffix):
+                    return line.split(" ", 1)[0]
+        
+        return None
+    
+    def invalidate_env(self) -> None:
+        """Drop the cached git environment so it is rebuilt on the next git call."""
+        self._env = None
     
     def _get_git_env(self) -> dict:
+        if self._env is not None:
+            return self._env
+        
         bot_user_id = None
         bot_name = None
         api_url = None
@@ -33,129 +173,176 @@ class GitOps:
             api_url = self.github_app_auth.api_url
             if not bot_user_id:
                 bot_user_id = self.github_app_auth.app_id
-        return get_git_env(bot_user_id=bot_user_id, bot_name=bot_name, api_url=api_url)
+        self._env = get_git_env(bot_user_id=bot_user_id, bot_name=bot_name, api_url=api_url)
+        return self._env
     
-    def _create_authenticated_url(self, repository_url: str) -> str:
+    def _get_auth_env(self, env: dict, host: Optional[str] = None) -> dict:
         """
-        Create authenticated URL for GitHub repository.
+        Add config to a git environment that authenticates a single git command against GitHub.
+        
+        The token is sent as an HTTP header scoped to the GitHub host. It is passed
+        through GIT_CONFIG_COUNT/GIT_CONFIG_KEY_n/GIT_CONFIG_VALUE_n rather than a
+        `-c` argument, so it never shows up in the process list, is never written
+        to .git/config, and no remote URL has to be swapped around the command.
         
         Args:
-            repository_url: Original repository URL
+            env: Git environment to extend (not modified)
+            host: GitHub host to authenticate against (derived from the API URL if not provided)
             
         Returns:
-            Authenticated URL with embedded token
+            Environment for the authenticated git command
         """
-        if not self.github_app_auth or not is_github_url(repository_url):
-            return repository_url
+        if not self.github_app_auth:
+            return env
         
-        parsed = urlparse(repository_url)
-        if not parsed.netloc:
-            return repository_url
-        
-        path = parsed.path
-        if not path.endswith(".git"):
-            path += ".git"
+        if not host:
+            host = urlparse(self.github_app_auth.api_url).netloc
+            if host.startswith("api."):
+                host = host[len("api."):]
         
         token = self.github_app_auth.get_installation_token()
-        auth_url = f"https://oauth2:{token}@{parsed.netloc}{path}"
-        return auth_url
-    
-    def _get_remote_url(self) -> Optional[str]:
-        env = self._get_git_env()
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    
-    def _set_remote_url(self, url: str) -> None:
-        env = self._get_git_env()
-        result = subprocess.run(
-            ["git", "remote", "set-url", "origin", url],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to set remote URL: {result.stderr}")
+        credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+        
+        # Append after any GIT_CONFIG_* entries the environment already carries
+        index = int(env.get("GIT_CONFIG_COUNT") or 0)
+        return {
+            **env,
+            "GIT_CONFIG_COUNT": str(index + 1),
+            f"GIT_CONFIG_KEY_{index}": f"http.https://{host}/.extraheader",
+            f"GIT_CONFIG_VALUE_{index}": f"AUTHORIZATION: basic {credentials}",
+        }
     
     def commit_changes(self, message: str) -> None:
         """
         Commit all changes with the given message.
         
+        Does nothing when the working tree is clean. Tracked changes are staged and
+        committed with a single `git commit -a`; `git add -A` only runs when there
+        are untracked files to pick up.
+        
         Args:
             message: Commit message
         """
+        tracked = self._has_tracked_changes()
+        untracked = tracked is None or self._has_untracked_files()
+        
+        if tracked is False and not untracked:
+            _LOG.info("Nothing to commit")
+            return
+        
         env = self._get_git_env()
         
+        if untracked:
+            result = subprocess.run(
+                [_GIT, "add", "-A"],
+                cwd=self.work_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                env=env,
+                close_fds=False,
+            )
+            
+            if result.returncode != 0:
+                raise RuntimeError(f"Failed to stage changes: {result.stderr.decode('utf-8', 'replace')}")
+            
+            commit_cmd = [_GIT, "commit", "-F", "-"]
+        else:
+            commit_cmd = [_GIT, "commit", "-a", "-F", "-"]
+        
+        # The message goes in on stdin so long messages never hit argv size limits
         result = subprocess.run(
-            ["git", "add", "-A"],
+            commit_cmd,
             cwd=self.work_dir,
-            capture_output=True,
-            text=True,
+            input=message.encode("utf-8"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to stage changes: {result.stderr}")
+            raise RuntimeError(f"Failed to commit: {result.stderr.decode('utf-8', 'replace')}")
+        
+        _LOG.info("Committed changes: %s", message)
+    
+    def push_branch(self, branch_name: str) -> None:
+        """
+        Push the branch to remote origin.
+        
+        Args:
+            branch_name: Name of the branch to push
+        """
+        env = self._get_auth_env(self._get_git_env())
         
         result = subprocess.run(
-            ["git", "commit", "-m", message],
+            [_GIT, "push", "-u", "origin", branch_name],
             cwd=self.work_dir,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to commit: {result.stderr}")
+            raise RuntimeError(f"Failed to push branch: {result.stderr.decode('utf-8', 'replace')}")
         
-        print(f"Committed changes: {message}")
+        _LOG.info("Pushed branch %s to remote", branch_name)
     
-    def push_branch(self, branch_name: str) -> None:
+    def _has_output(self, args: list) -> bool:
         """
-        Push the branch to remote origin.
+        Check whether a git command writes anything to stdout, stopping it at the first byte.
         
         Args:
-            branch_name: Name of the branch to push
+            args: git arguments (without the executable)
+            
+        Returns:
+            True if the command produced output, False otherwise
         """
-        env = self._get_git_env()
-        
-        original_url = None
-        if self.github_app_auth:
-            original_url = self._get_remote_url()
-            if original_url:
-                auth_url = self._create_authenticated_url(original_url)
-                if auth_url != original_url:
-                    print("Setting up authenticated remote for push...")
-                    self._set_remote_url(auth_url)
+        proc = subprocess.Popen(
+            [_GIT, *args],
+            cwd=self.work_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=self._get_git_env(),
+            close_fds=False,
+        )
         
         try:
-            result = subprocess.run(
-                ["git", "push", "-u", "origin", branch_name],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to push branch: {result.stderr}")
-            
-            print(f"Pushed branch {branch_name} to remote")
-            
+            first = proc.stdout.read(1)
         finally:
-            if original_url and self.github_app_auth:
-                print("Restoring clean remote URL...")
-                self._set_remote_url(original_url)
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+        
+        return first != b""
+    
+    def _has_tracked_changes(self) -> Optional[bool]:
+        """
+        Check for staged or unstaged changes to tracked files.
+        
+        Returns:
+            True or False from the exit code of `git diff --quiet HEAD`, or None
+            when there is no HEAD to compare against yet
+        """
+        result = subprocess.run(
+            [_GIT, "diff", "--quiet", "HEAD", "--"],
+            cwd=self.work_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=self._get_git_env(),
+            close_fds=False,
+        )
+        
+        if result.returncode == 0:
+            return False
+        if result.returncode == 1:
+            return True
+        return None
+    
+    def _has_untracked_files(self) -> bool:
+        """Check for untracked files that are not ignored."""
+        return self._has_output(["ls-files", "--others", "--exclude-standard", "-z"])
     
     def has_uncommitted_changes(self) -> bool:
         """
@@ -164,17 +351,12 @@ class GitOps:
         Returns:
             True if there are uncommitted changes, False otherwise
         """
-        env = self._get_git_env()
+        tracked = self._has_tracked_changes()
         
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
+        if tracked is None:
+            return self._has_output(["status", "--porcelain", "-z"])
         
-        return result.stdout.strip() != ""
+        return tracked or self._has_untracked_files()
     
     def get_latest_commit_hash(self) -> Optional[str]:
         """
@@ -183,18 +365,26 @@ class GitOps:
         Returns:
             Commit hash or None if no commits exist
         """
+        head = self._read_git_file("HEAD")
+        if head and _OBJECT_ID_RE.fullmatch(head):
+            return head
+        if head and head.startswith("ref: ") and head != "ref: refs/heads/.invalid":
+            object_id = self._resolve_ref(head[5:])
+            if object_id:
+                return object_id
+        
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+            [_GIT, "rev-parse", "HEAD"],
             cwd=self.work_dir,
             capture_output=True,
-            text=True,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout.decode("ascii", "replace").strip()
         
         return None
     
@@ -205,18 +395,24 @@ class GitOps:
         Returns:
             Branch name or None if no branch is checked out
         """
+        head = self._read_git_file("HEAD")
+        if head and _OBJECT_ID_RE.fullmatch(head):
+            return "HEAD"
+        if head and head.startswith("ref: refs/heads/") and head != "ref: refs/heads/.invalid":
+            return head[len("ref: refs/heads/"):]
+        
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            [_GIT, "rev-parse", "--abbrev-ref", "HEAD"],
             cwd=self.work_dir,
             capture_output=True,
-            text=True,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout.decode("utf-8", "replace").strip()
         
         return None
     
@@ -230,14 +426,25 @@ class GitOps:
         Returns:
             Commit message
         """
+        if commit_hash in self._msg_cache:
+            return self._msg_cache[commit_hash]
+        
+        message = self._read_commit_message(commit_hash)
+        if message is not None:
+            message = message.strip()
+            if _OBJECT_ID_RE.fullmatch(commit_hash):
+                self._msg_cache[commit_hash] = message
+            return message
+        
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "log", "-1", "--pretty=%B", commit_hash],
+            [_GIT, "log", "-1", "--pretty=%B", commit_hash],
             cwd=self.work_dir,
             capture_output=True,
             text=True,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
@@ -254,57 +461,54 @@ class GitOps:
         """
         env = self._get_git_env()
         
-        result = subprocess.run(
-            ["git", "log", "-1", "--pretty=format:%B"],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            print(f"Warning: Failed to get commit message: {result.stderr}")
+        try:
+            commit_message = self._read_commit_message("HEAD")
+        except RuntimeError as e:
+            _LOG.warning("%s", e)
             return
         
-        commit_message = result.stdout
-        
-        lines = commit_message.split("\n")
-        cleaned_lines = []
-        has_unwanted = False
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("Co-Authored-By:"):
-                has_unwanted = True
-                continue
-            if stripped == "🤖 Generated with Claude Code" or "🤖 Generated with Claude Code" in stripped:
-                has_unwanted = True
-                continue
-            cleaned_lines.append(line)
+        if commit_message is None:
+            result = subprocess.run(
+                [_GIT, "log", "-1", "--pretty=format:%B"],
+                cwd=self.work_dir,
+                capture_output=True,
+                text=True,
+                env=env,
+                close_fds=False,
+            )
+            
+            if result.returncode != 0:
+                _LOG.warning("Failed to get commit message: %s", result.stderr)
+                return
+            
+            commit_message = result.stdout
         
-        if not has_unwanted:
+        if _CO_AUTHOR_MARKER not in commit_message and _GENERATED_MARKER not in commit_message:
             return
         
+        cleaned_lines = [
+            line for line in commit_message.split("\n")
+            if not _UNWANTED_COMMIT_LINE_RE.search(line)
+        ]
         cleaned_message = "\n".join(cleaned_lines).strip()
-        while cleaned_message.endswith("\n\n"):
-            cleaned_message = cleaned_message[:-1]
+        
+        if cleaned_message == commit_message.strip():
+            return
         
         result = subprocess.run(
-            ["git", "commit", "--amend", "-m", cleaned_message],
+            [_GIT, "commit", "--amend", "-F", "-"],
             cwd=self.work_dir,
-            capture_output=True,
-            text=True,
+            input=cleaned_message.encode("utf-8"),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
-            print(f"Warning: Failed to clean commit message: {result.stderr}")
+            _LOG.warning("Failed to clean commit message: %s", result.stderr.decode('utf-8', 'replace'))
         else:
-            print("Cleaned commit message (removed Co-Authored-By trailers and unwanted text)")
-    
-    def _is_authenticated_url(self, url: str) -> bool:
-        """Check if URL contains authentication token."""
-        return "oauth2:" in url or "@" in url and "token" in url
+            _LOG.info("Cleaned commit message (removed Co-Authored-By trailers and unwanted text)")
     
     def fetch_from_remote(self) -> bool:
         """
@@ -313,38 +517,24 @@ class GitOps:
         Returns:
             True if fetch was successful, False otherwise
         """
-        print("Fetching latest changes from remote...")
+        _LOG.info("Fetching latest changes from remote...")
         
-        original_url = None
+        env = self._get_auth_env(self._get_git_env())
+        result = subprocess.run(
+            [_GIT, "fetch", "origin"],
+            cwd=self.work_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=env,
+            close_fds=False,
+        )
         
-        if self.github_app_auth:
-            original_url = self._get_remote_url()
-            if original_url and not self._is_authenticated_url(original_url):
-                auth_url = self._create_authenticated_url(original_url)
-                print("Setting up authenticated remote URL for fetch...")
-                self._set_remote_url(auth_url)
+        if result.returncode != 0:
+            _LOG.warning("Failed to fetch from remote: %s", result.stderr.decode('utf-8', 'replace').strip())
+            return False
         
-        try:
-            env = self._get_git_env()
-            result = subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            
-            if result.returncode != 0:
-                print(f"Warning: Failed to fetch from remote: {result.stderr.strip()}")
-                return False
-            
-            print("Successfully fetched from remote")
-            return True
-            
-        finally:
-            if self.github_app_auth and original_url:
-                print("Restoring clean remote URL...")
-                self._set_remote_url(original_url)
+        _LOG.info("Successfully fetched from remote")
+        return True
     
     def pull_latest_changes(self, branch_name: str) -> bool:
         """
@@ -356,41 +546,27 @@ class GitOps:
         Returns:
             True if pull was successful, False otherwise
         """
-        print(f"Pulling latest changes from branch: {branch_name}")
+        _LOG.info("Pulling latest changes from branch: %s", branch_name)
         
-        original_url = None
+        env = self._get_auth_env(self._get_git_env())
+        result = subprocess.run(
+            [_GIT, "pull", "origin", branch_name],
+            cwd=self.work_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=env,
+            close_fds=False,
+        )
         
-        if self.github_app_auth:
-            original_url = self._get_remote_url()
-            if original_url and not self._is_authenticated_url(original_url):
-                auth_url = self._create_authenticated_url(original_url)
-                print("Setting up authenticated remote URL for pull...")
-                self._set_remote_url(auth_url)
+        if result.returncode != 0:
+            _LOG.warning("Failed to pull latest changes: %s", result.stderr.decode('utf-8', 'replace').strip())
+            return False
         
-        try:
-            env = self._get_git_env()
-            result = subprocess.run(
-                ["git", "pull", "origin", branch_name],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            
-            if result.returncode != 0:
-                print(f"Warning: Failed to pull latest changes: {result.stderr.strip()}")
-                return False
-            
-            print("Successfully pulled latest changes")
-            return True
-            
-        finally:
-            if self.github_app_auth and original_url:
-                print("Restoring clean remote URL...")
-                self._set_remote_url(original_url)
+        _LOG.info("Successfully pulled latest changes")
+        return True
     
     @staticmethod
-    def clone_repository(repo_url: str, target_dir: Path, github_app_auth: Optional[GitHubAppAuth] = None) -> None:
+    def clone_repository(repo_url: str, target_dir: Path, github_app_auth: Optional["GitHubAppAuth"] = None) -> None:
         """
         Clone a repository into the target directory with optional authentication.
         
@@ -399,22 +575,35 @@ class GitOps:
             target_dir: Target directory to clone into
             github_app_auth: Optional GitHub App authentication instance
         """
-        auth_repo_url = repo_url
+        clone_url = repo_url
+        env = get_git_env()
+        authenticated = False
         
         if github_app_auth and is_github_url(repo_url):
-            temp_git_ops = GitOps(target_dir, github_app_auth)
-            auth_repo_url = temp_git_ops._create_authenticated_url(repo_url)
-            print(f"Cloning repository with authentication")
+            parsed = urlparse(repo_url)
+            path = parsed.path
+            if not path.endswith(".git"):
+                path += ".git"
+            clone_url = f"https://{parsed.netloc}{path}"
+            env = GitOps(target_dir, github_app_auth)._get_auth_env(env, parsed.netloc)
+            authenticated = True
+            _LOG.info("Cloning repository with authentication")
         else:
-            print(f"Cloning repository: {repo_url}")
+            _LOG.info("Cloning repository: %s", repo_url)
         
-        env = get_git_env()
+        clone_cmd = [_GIT, "clone"]
+        if not authenticated:
+            # Partial clone: blobs outside the checkout are fetched on demand, which
+            # only works while the remote stays reachable without credentials
+            clone_cmd.append("--filter=blob:none")
+        clone_cmd.extend([clone_url, str(target_dir)])
         
         result = subprocess.run(
-            ["git", "clone", auth_repo_url, str(target_dir)],
+            clone_cmd,
             capture_output=True,
             text=True,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
@@ -431,10 +620,6 @@ class GitOps:
                 )
             else:
                 raise RuntimeError(f"Failed to clone repository: {result.stderr}")
-        
-        if github_app_auth and is_github_url(repo_url):
-            git_ops = GitOps(target_dir, github_app_auth)
-            git_ops.reset_remote_url(repo_url)
     
     def reset_remote_url(self, clean_url: str) -> None:
         """
@@ -453,33 +638,60 @@ class GitOps:
         
         env = self._get_git_env()
         result = subprocess.run(
-            ["git", "remote", "set-url", "origin", clean_remote_url],
+            [_GIT, "remote", "set-url", "origin", clean_remote_url],
             cwd=self.work_dir,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
-            print(f"Warning: Failed to reset remote URL: {result.stderr}")
+            _LOG.warning("Failed to reset remote URL: %s", result.stderr.decode('utf-8', 'replace'))
         else:
-            print(f"Reset remote URL to clean format: {clean_remote_url}")
+            _LOG.info("Reset remote URL to clean format: %s", clean_remote_url)
     
     def detect_default_branch(self) -> str:
         """
         Detect the default branch of the repository.
         
+        The result is remembered for the lifetime of this instance.
+        
         Returns:
             Name of the default branch (main or master)
         """
+        if self._default_branch is None:
+            self._default_branch = self._detect_default_branch()
+        return self._default_branch
+    
+    def _detect_default_branch(self) -> str:
+        # git clone records the remote's default branch as origin/HEAD, so no
+        # network round-trip is needed when that symbolic ref is present
+        origin_head = self._read_git_file("refs/remotes/origin/HEAD")
+        if origin_head and origin_head.startswith("ref: refs/remotes/origin/"):
+            return origin_head[len("ref: refs/remotes/origin/"):]
+        
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "remote", "show", "origin"],
+            [_GIT, "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
+            cwd=self.work_dir,
+            capture_output=True,
+            text=True,
+            env=env,
+            close_fds=False,
+        )
+        
+        if result.returncode == 0 and result.stdout.startswith("origin/"):
+            return result.stdout.strip()[len("origin/"):]
+        
+        result = subprocess.run(
+            [_GIT, "remote", "show", "origin"],
             cwd=self.work_dir,
             capture_output=True,
             text=True,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode == 0:
@@ -488,11 +700,12 @@ class GitOps:
                     return line.split("HEAD branch:")[1].strip()
         
         result = subprocess.run(
-            ["git", "branch", "-r"],
+            [_GIT, "branch", "-r"],
             cwd=self.work_dir,
             capture_output=True,
             text=True,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode == 0:
@@ -514,16 +727,17 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "checkout", branch_name],
+            [_GIT, "checkout", branch_name],
             cwd=self.work_dir,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
             raise RuntimeError(
-                f"Failed to checkout branch {branch_name}: {result.stderr}"
+                f"Failed to checkout branch {branch_name}: {result.stderr.decode('utf-8', 'replace')}"
             )
     
     def create_branch(self, branch_name: str) -> None:
@@ -536,16 +750,17 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "checkout", "-b", branch_name],
+            [_GIT, "checkout", "-b", branch_name],
             cwd=self.work_dir,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             env=env,
+            close_fds=False,
         )
         
         if result.returncode != 0:
             raise RuntimeError(
-                f"Failed to create branch {branch_name}: {result.stderr}"
+                f"Failed to create branch {branch_name}: {result.stderr.decode('utf-8', 'replace')}"
             )
     
     def configure_git_author(self) -> None:
@@ -557,7 +772,7 @@ class GitOps:
         if not bot_user_id:
             app_id = self.github_app_auth.app_id
             if app_id:
-                print(f"Warning: Could not retrieve bot user ID, using app ID as fallback: {app_id}")
+                _LOG.warning("Could not retrieve bot user ID, using app ID as fallback: %s", app_id)
                 bot_user_id = app_id
             else:
                 return
@@ -565,29 +780,44 @@ class GitOps:
         bot_name = self.github_app_auth.get_bot_login()
         api_url = self.github_app_auth.api_url
         author_info = get_codebot_git_author_info(bot_user_id, bot_name, api_url)
+        self.invalidate_env()
+        
         env = self._get_git_env()
+        wanted = {"user.name": author_info["author_name"], "user.email": author_info["author_email"]}
         
+        # Reused workspaces are usually configured already; one read covers both keys
         result = subprocess.run(
-            ["git", "config", "user.name", author_info["author_name"]],
+            [_GIT, "config", "--local", "--null", "--get-regexp", r"^user\.(name|email)$"],
             cwd=self.work_dir,
             capture_output=True,
-            text=True,
             env=env,
+            close_fds=False,
         )
         
-        if result.returncode != 0:
-            print(f"Warning: Failed to set git user.name: {result.stderr}")
-        
-        result = subprocess.run(
-            ["git", "config", "user.email", author_info["author_email"]],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
+        current = {}
+        if result.returncode == 0:
+            for entry in result.stdout.decode("utf-8", "replace").split("\0"):
+                key, sep, value = entry.partition("\n")
+                if sep:
+                    current[key] = value
+        
+        configured = True
+        for key, value in wanted.items():
+            if current.get(key) == value:
+                continue
+            
+            result = subprocess.run(
+                [_GIT, "config", key, value],
+                cwd=self.work_dir,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                env=env,
+                close_fds=False,
+            )
+            
+            if result.returncode != 0:
+                _LOG.warning("Failed to set git %s: %s", key, result.stderr.decode("utf-8", "replace"))
+                configured = False
         
-        if result.returncode != 0:
-            print(f"Warning: Failed to set git user.email: {result.stderr}")
-        else:
-            print(f"Configured git author: {author_info['author_name']} <{author_info['author_email']}>")
-
+        if configured:
+            _LOG.info("Configured git author: %s <%s>", author_info['author_name'], author_info['author_email'])
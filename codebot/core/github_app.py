@@ -1,6 +1,7 @@
 """GitHub App authentication using JWT and installation tokens."""
 
 import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
@@ -8,9 +9,50 @@ from typing import Optional
 
 import jwt
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from codebot.core.utils import detect_github_api_url
+from codebot.core.utils import detect_github_api_url, load_dotenv_once
+
+# The adapter (and its urllib3 connection pools, which are thread-safe) is shared by
+# every thread; requests.Session itself is not documented as thread-safe, so each
+# thread gets its own session on top of it.
+_github_adapter: Optional[HTTPAdapter] = None
+_github_adapter_lock = threading.Lock()
+_thread_sessions = threading.local()
+
+
+def _get_github_adapter() -> HTTPAdapter:
+    global _github_adapter
+    with _github_adapter_lock:
+        if _github_adapter is None:
+            _github_adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            )
+        return _github_adapter
+
+
+def get_github_session() -> requests.Session:
+    """
+    Get the calling thread's requests session for GitHub API calls.
+    
+    All sessions share one pooled adapter, so connections, and their TLS sessions,
+    are kept alive across calls and threads.
+    
+    Returns:
+        requests.Session with the shared pooled, retrying adapter
+    """
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = "codebot"
+        adapter = _get_github_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_sessions.session = session
+    return session
 
 
 class GitHubAppAuth:
@@ -32,7 +74,7 @@ class GitHubAppAuth:
             installation_id: Installation ID (defaults to GITHUB_APP_INSTALLATION_ID env var)
             api_url: GitHub API URL (auto-detected if not provided)
         """
-        load_dotenv()
+        load_dotenv_once()
         
         app_id_env = os.getenv("GITHUB_APP_ID")
         private_key_path_env = os.getenv("GITHUB_APP_PRIVATE_KEY_PATH")
@@ -108,6 +150,7 @@ class GitHubAppAuth:
         
         self._installation_token: Optional[str] = None
         self._token_expires_at: float = 0
+        self._token_lock = threading.Lock()
         self._bot_user_id: Optional[str] = None
     
     def get_installation_token(self) -> str:
@@ -120,36 +163,41 @@ class GitHubAppAuth:
         if self._installation_token and time.time() < (self._token_expires_at - 300):
             return self._installation_token
         
-        jwt_token = self._generate_jwt()
-        
-        url = f"{self.api_url}/app/installations/{self.installation_id}/access_tokens"
-        headers = {
-            "Authorization": f"Bearer {jwt_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-        
-        response = requests.post(url, headers=headers, timeout=10)
-        
-        if response.status_code != 201:
-            error_data = response.json() if response.content else {}
-            error_msg = error_data.get("message", "Unknown error")
-            raise RuntimeError(
-                f"Failed to get installation access token: {error_msg}\n"
-                f"Status code: {response.status_code}\n"
-                f"Response: {error_data}"
-            )
-        
-        token_data = response.json()
-        self._installation_token = token_data["token"]
-        
-        expires_at_str = token_data.get("expires_at")
-        if expires_at_str:
-            expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
-            self._token_expires_at = expires_at.timestamp()
-        else:
-            self._token_expires_at = time.time() + 3600
-        
-        return self._installation_token
+        # Workers share this instance, so only one of them refreshes an expiring token
+        with self._token_lock:
+            if self._installation_token and time.time() < (self._token_expires_at - 300):
+                return self._installation_token
+            
+            jwt_token = self._generate_jwt()
+            
+            url = f"{self.api_url}/app/installations/{self.installation_id}/access_tokens"
+            headers = {
+                "Authorization": f"Bearer {jwt_token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+            
+            response = get_github_session().post(url, headers=headers, timeout=10)
+            
+            if response.status_code != 201:
+                error_data = response.json() if response.content else {}
+                error_msg = error_data.get("message", "Unknown error")
+                raise RuntimeError(
+                    f"Failed to get installation access token: {error_msg}\n"
+                    f"Status code: {response.status_code}\n"
+                    f"Response: {error_data}"
+                )
+            
+            token_data = response.json()
+            self._installation_token = token_data["token"]
+            
+            expires_at_str = token_data.get("expires_at")
+            if expires_at_str:
+                expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
+                self._token_expires_at = expires_at.timestamp()
+            else:
+                self._token_expires_at = time.time() + 3600
+            
+            return self._installation_token
     
     def _generate_jwt(self) -> str:
         """
@@ -210,7 +258,7 @@ class GitHubAppAuth:
         }
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_github_session().get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 error_data = response.json() if response.content else {}
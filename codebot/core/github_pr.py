@@ -4,9 +4,7 @@ import re
 from typing import Optional, Tuple
 from urllib.parse import urlparse
 
-import requests
-
-from codebot.core.github_app import GitHubAppAuth
+from codebot.core.github_app import GitHubAppAuth, get_github_session
 from codebot.core.utils import detect_github_api_url, detect_github_info
 
 
@@ -154,7 +152,7 @@ class GitHubPR:
         print(f"  To branch: {base_branch}")
         print(f"  Repository: {owner}/{repo}")
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = get_github_session().post(url, headers=self.headers, json=data)
         
         if response.status_code != 201:
             error_data = response.json()
@@ -291,7 +289,7 @@ class GitHubPR:
             PR data from GitHub API
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}")
-        response = requests.get(url, headers=self.headers)
+        response = get_github_session().get(url, headers=self.headers)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to get PR details: {response.status_code}")
@@ -311,7 +309,7 @@ class GitHubPR:
             Formatted string of files changed
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}/files")
-        response = requests.get(url, headers=self.headers)
+        response = get_github_session().get(url, headers=self.headers)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to get PR files: {response.status_code}")
@@ -344,7 +342,7 @@ class GitHubPR:
             "in_reply_to": comment_id
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = get_github_session().post(url, headers=self.headers, json=data)
         
         if response.status_code != 201:
             raise RuntimeError(f"Failed to post reply: {response.status_code} - {response.text}")
@@ -367,7 +365,7 @@ class GitHubPR:
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/issues/{pr_number}/comments")
         data = {"body": body}
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = get_github_session().post(url, headers=self.headers, json=data)
         
         if response.status_code != 201:
             raise RuntimeError(f"Failed to post comment: {response.status_code} - {response.text}")
@@ -396,7 +394,7 @@ class GitHubPR:
             "body": cleaned_body
         }
         
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = get_github_session().patch(url, headers=self.headers, json=data)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to update PR: {response.status_code} - {response.text}")
@@ -417,7 +415,7 @@ class GitHubPR:
             List of comments in the thread, ordered chronologically
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}/comments")
-        response = requests.get(url, headers=self.headers)
+        response = get_github_session().get(url, headers=self.headers)
         
         if response.status_code != 200:
             return []
@@ -481,7 +479,7 @@ class GitHubPR:
         params = {}
         if since:
             params["since"] = since
-        response = requests.get(url, headers=self.headers, params=params)
+        response = get_github_session().get(url, headers=self.headers, params=params)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to get PR review comments: {response.status_code}")
@@ -511,7 +509,7 @@ class GitHubPR:
         params = {}
         if since:
             params["since"] = since
-        response = requests.get(url, headers=self.headers, params=params)
+        response = get_github_session().get(url, headers=self.headers, params=params)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to get PR issue comments: {response.status_code}")
@@ -541,7 +539,7 @@ class GitHubPR:
         params = {}
         if since:
             params["since"] = since
-        response = requests.get(url, headers=self.headers, params=params)
+        response = get_github_session().get(url, headers=self.headers, params=params)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to get PR reviews: {response.status_code}")
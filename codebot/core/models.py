@@ -38,3 +38,25 @@ class Task:
     error: Optional[str] = None
     subtasks: List["Task"] = field(default_factory=list)
     logs: Optional[List[dict]] = None
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewEvent:
+    """PR comment or review queued for the review processor."""
+    
+    type: str
+    comment_id: Optional[int]
+    comment_body: str
+    pr_number: Optional[int]
+    pr_title: Optional[str]
+    pr_body: Optional[str]
+    branch_name: Optional[str]
+    repo_url: Optional[str]
+    repo_owner: Optional[str]
+    repo_name: Optional[str]
+    comment_path: Optional[str] = None
+    comment_line: Optional[int] = None
+    comment_diff_hunk: str = ""
+    comment_position: Optional[int] = None
+    in_reply_to_id: Optional[int] = None
+    review_state: Optional[str] = None
@@ -183,15 +183,11 @@ class Orchestrator:
         print("CHANGES MADE BY CLAUDE:")
         print("=" * 80)
         
-        if after_commit:
-            result = subprocess.run(
-                ["git", "log", "-1", "--pretty=format:%B", after_commit],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                print(f"\nCommit message:\n{result.stdout}\n")
+        if after_commit and self.git_ops:
+            try:
+                print(f"\nCommit message:\n{self.git_ops.get_commit_message(after_commit)}\n")
+            except RuntimeError:
+                pass
         
         if before_commit:
             result = subprocess.run(
@@ -266,14 +262,10 @@ class Orchestrator:
         if self.git_ops:
             commit_message = self.git_ops.get_latest_commit_hash()
             if commit_message:
-                result = subprocess.run(
-                    ["git", "log", "-1", "--pretty=format:%B"],
-                    cwd=self.work_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    commit_message = result.stdout.strip()
+                try:
+                    commit_message = self.git_ops.get_commit_message(commit_message)
+                except RuntimeError:
+                    pass
         
         files_changed = None
         if self.git_ops:
@@ -4,7 +4,7 @@ import json
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from codebot.core.models import Task, TaskPrompt
 from codebot.core.storage import TaskStorage
@@ -268,6 +268,19 @@ class SQLiteTaskStorage(TaskStorage):
         """, (json.dumps(logs), task_id))
         self.conn.commit()
     
+    def update_task_logs_batch(self, entries: List[Tuple[str, List[dict]]]) -> None:
+        """
+        Update the logs of several tasks in a single transaction.
+        
+        Args:
+            entries: (task ID, log entries) pairs
+        """
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            UPDATE tasks SET logs_json = ? WHERE id = ?
+        """, [(json.dumps(logs), task_id) for task_id, logs in entries])
+        self.conn.commit()
+    
     def cleanup_old_logs(self, cutoff_date: datetime) -> None:
         """
         Clean up old logs from database.
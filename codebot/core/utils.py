@@ -1,9 +1,15 @@
 """Utility functions for codebot."""
 
+import functools
 import hashlib
+import json
+import logging
 import os
+import re
+import secrets
 import shutil
-import uuid
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -11,8 +17,11 @@ from urllib.parse import urlparse
 
 from codebot.core.task_store import global_task_store
 
+# The short UUID segment of a codebot branch name
+_SHORT_UUID_MATCH = re.compile(r"[0-9a-f]{7}").fullmatch
 
-def validate_github_app_config(api_url: Optional[str] = None, repository_url: Optional[str] = None, verbose: bool = False) -> Tuple[bool, Optional[str]]:
+
+def validate_github_app_config(api_url: Optional[str] = None, repository_url: Optional[str] = None, verbose: bool = False, use_cache: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Validate GitHub App configuration by testing authentication.
     
@@ -20,6 +29,8 @@ def validate_github_app_config(api_url: Optional[str] = None, repository_url: Op
         api_url: Optional API URL (auto-detected if not provided)
         repository_url: Optional repository URL to derive API URL from
         verbose: Enable verbose logging for debugging
+        use_cache: Reuse a recent successful validation of the same configuration
+            instead of requesting an installation token
         
     Returns:
         Tuple of (is_valid, error_message). error_message is None if valid.
@@ -39,6 +50,14 @@ def validate_github_app_config(api_url: Optional[str] = None, repository_url: Op
         
         if verbose:
             print("  → GitHub App configuration loaded successfully")
+        
+        cache_key = _get_validation_cache_key(github_app_auth) if use_cache else None
+        if cache_key and _is_validation_cached(cache_key):
+            if verbose:
+                print("  → Using cached GitHub App validation result")
+            return True, None
+        
+        if verbose:
             print("  → Testing authentication by getting installation token...")
         
         token = github_app_auth.get_installation_token()
@@ -47,6 +66,9 @@ def validate_github_app_config(api_url: Optional[str] = None, repository_url: Op
             print(f"  → Installation token obtained successfully (starts with: {token[:8]}...)")
             print("  → GitHub App configuration is valid")
         
+        if cache_key:
+            _store_validation(cache_key)
+        
         # If we can get the installation token, the configuration is valid
         # The token itself will be validated when making actual API calls
         return True, None
@@ -67,6 +89,78 @@ def validate_github_app_config(api_url: Optional[str] = None, repository_url: Op
         return False, "api_error"
 
 
+VALIDATION_CACHE_TTL = 3600
+
+
+def _get_validation_cache_path() -> Path:
+    cache_home = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "codebot" / "github_app_validation.json"
+
+
+def _get_validation_cache_key(github_app_auth) -> str:
+    """
+    Build a fingerprint of a loaded GitHub App configuration.
+    
+    Covers everything GitHubAppAuth checks when it is created, so a cached result
+    stops matching as soon as any of it changes.
+    
+    Args:
+        github_app_auth: GitHubAppAuth built from the configuration being validated
+        
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in (
+        github_app_auth.app_id,
+        github_app_auth.installation_id,
+        github_app_auth.api_url,
+        github_app_auth.bot_name,
+        str(github_app_auth.private_key_path_resolved),
+        github_app_auth.private_key,
+    ):
+        digest.update(str(part).encode() + b"\0")
+    return digest.hexdigest()
+
+
+def _is_validation_cached(cache_key: str) -> bool:
+    try:
+        cached = json.loads(_get_validation_cache_path().read_text())
+        return cached.get("key") == cache_key and time.time() - cached.get("validated_at", 0) < VALIDATION_CACHE_TTL
+    except (OSError, ValueError, AttributeError):
+        return False
+
+
+def _store_validation(cache_key: str) -> None:
+    cache_path = _get_validation_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"key": cache_key, "validated_at": time.time()}))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def validate_github_app_config_cached(api_url: Optional[str] = None, repository_url: Optional[str] = None, verbose: bool = False) -> Tuple[bool, Optional[str]]:
+    """
+    Validate GitHub App configuration, reusing a recent successful validation.
+    
+    The configuration is always loaded and checked locally. Only the installation
+    token request is skipped when the same configuration validated successfully in
+    the last VALIDATION_CACHE_TTL seconds. Failures are never cached.
+    
+    Args:
+        api_url: Optional API URL (auto-detected if not provided)
+        repository_url: Optional repository URL to derive API URL from
+        verbose: Enable verbose logging for debugging
+        
+    Returns:
+        Tuple of (is_valid, error_message). error_message is None if valid.
+    """
+    return validate_github_app_config(api_url=api_url, repository_url=repository_url, verbose=verbose, use_cache=True)
+
+
 def detect_github_info(repository_url: str) -> Dict[str, str]:
     """
     Detect GitHub instance information from repository URL.
@@ -205,6 +299,24 @@ def get_codebot_git_author_info(bot_user_id: str, bot_name: Optional[str] = None
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _base_git_env() -> Dict[str, str]:
+    """
+    Snapshot os.environ with the non-interactive git settings applied.
+    
+    Cleared by load_dotenv_once; anything else that changes os.environ after the first
+    git call must call _base_git_env.cache_clear() for git to see it.
+    
+    Returns:
+        Shared dictionary; callers must copy it before modifying
+    """
+    return {
+        **os.environ,
+        "GIT_TERMINAL_PROMPT": "0",  # Disable terminal prompts
+        "GIT_ASKPASS": "echo",       # Use echo as askpass (returns empty)
+    }
+
+
 def get_git_env(bot_user_id: Optional[str] = None, bot_name: Optional[str] = None, api_url: Optional[str] = None) -> Dict[str, str]:
     """
     Get git environment variables for non-interactive operation.
@@ -217,11 +329,8 @@ def get_git_env(bot_user_id: Optional[str] = None, bot_name: Optional[str] = Non
     Returns:
         Dictionary of environment variables for git operations
     """
-    env = {
-        **os.environ,
-        "GIT_TERMINAL_PROMPT": "0",  # Disable terminal prompts
-        "GIT_ASKPASS": "echo",       # Use echo as askpass (returns empty)
-    }
+    # Copying a plain dict is much cheaper than re-reading os.environ
+    env = dict(_base_git_env())
     
     # If bot_user_id is provided, set git author/committer information
     if bot_user_id:
@@ -234,11 +343,83 @@ def get_git_env(bot_user_id: Optional[str] = None, bot_name: Optional[str] = Non
     return env
 
 
+_dotenv_loaded = False
+
+
+def load_dotenv_once() -> None:
+    """Load environment variables from a .env file, only on the first call in this process."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    
+    # Import here to avoid loading python-dotenv on code paths that never need it
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    _dotenv_loaded = True
+    _base_git_env.cache_clear()
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    Stream handler that writes to the current sys.stdout, so LogCapture sees the output.
+    
+    sys.stdout is looked up on every record rather than bound at construction;
+    a stream passed to setStream() takes precedence.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.stream = None
+    
+    def _target(self):
+        return self.stream if self.stream is not None else sys.stdout
+    
+    def flush(self) -> None:
+        with self.lock:
+            stream = self._target()
+            if hasattr(stream, "flush"):
+                stream.flush()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._target().write(self.format(record) + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Plain messages for progress output; warnings and errors are prefixed with their level."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname}: {message}"
+        return message
+
+
+def configure_logging(verbose: bool = True) -> None:
+    """
+    Route codebot progress messages to stdout.
+    
+    Args:
+        verbose: Show informational progress messages; otherwise only warnings and errors
+    """
+    logger = logging.getLogger("codebot")
+    if not any(isinstance(handler, _StdoutHandler) for handler in logger.handlers):
+        handler = _StdoutHandler()
+        handler.setFormatter(_ConsoleFormatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
+    logger.propagate = False
+
+
 def generate_short_uuid() -> str:
     """Generate a short UUID (7 characters) for use in branch names and directory names."""
-    uuid_str = str(uuid.uuid4())
-    sha256_hash = hashlib.sha256(uuid_str.encode()).hexdigest()
-    return sha256_hash[:7]
+    return secrets.token_hex(4)[:7]
 
 
 def generate_branch_name(
@@ -313,7 +494,7 @@ def extract_uuid_from_branch(branch_name: str) -> Optional[str]:
     
     # Find the UUID part (7-character hash)
     for part in parts[2:]:
-        if len(part) == 7 and all(c in "0123456789abcdef" for c in part):
+        if _SHORT_UUID_MATCH(part):
             return part
     
     return None
@@ -335,12 +516,18 @@ def find_workspace_by_uuid(base_dir: Path, uuid: str) -> Optional[Path]:
     if not base_dir.exists():
         return None
     
-    # Search for directories matching the pattern
-    for item in base_dir.iterdir():
-        if item.is_dir() and item.name.endswith(f"_{uuid}"):
-            return item
-        elif item.is_dir() and item.name == f"task_{uuid}":
-            return item
+    # Workspaces without a ticket ID have a fixed name, so try that before scanning
+    direct = base_dir / f"task_{uuid}"
+    if direct.is_dir():
+        return direct
+    
+    suffix = f"_{uuid}"
+    
+    # Search for directories matching the pattern; scandir has the entry type without a stat
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_dir():
+                return Path(entry.path)
     
     return None
 
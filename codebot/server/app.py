@@ -2,14 +2,10 @@
 
 import os
 import sys
-import threading
 from pathlib import Path
+from typing import Optional
 
 import click
-from dotenv import load_dotenv
-
-from codebot.core.github_app import GitHubAppAuth
-from codebot.core.utils import validate_github_app_config
 
 
 @click.command(name="serve")
@@ -48,6 +44,12 @@ from codebot.core.utils import validate_github_app_config
     default=1,
     help="Number of task processor worker threads (default: 1)",
 )
+@click.option(
+    "--review-workers",
+    type=int,
+    default=None,
+    help="Number of PRs whose review comments are processed in parallel (default: ~3/4 of CPU count)",
+)
 @click.option(
     "--enable-polling",
     is_flag=True,
@@ -73,12 +75,13 @@ def serve(
     debug: bool,
     api_key: str,
     workers: int,
+    review_workers: Optional[int],
     enable_polling: bool,
     poll_interval: int,
     reset_poll_times: bool,
 ) -> None:
     """
-    Start webhook server to handle PR review comments, HTTP task submissions, and web interface.
+    Start the webhook server, task API and web interface.
     
     This command starts a Flask server that:
     - Provides a web interface for viewing and managing tasks (CLI and web-initiated)
@@ -108,11 +111,17 @@ def serve(
     For HTTP API:
     - Set CODEBOT_API_KEYS environment variable with comma-separated API keys
     - Use --workers to scale task processing
+    - Use --review-workers to scale PR review comment processing
     """
-    load_dotenv()
+    # Import here so that --help and argument errors don't load the GitHub App stack
+    from codebot.core.github_app import GitHubAppAuth
+    from codebot.core.utils import configure_logging, load_dotenv_once, validate_github_app_config_cached
+    
+    load_dotenv_once()
+    configure_logging()
     
     print("Validating GitHub App configuration...")
-    is_valid, error_type = validate_github_app_config(verbose=True)
+    is_valid, error_type = validate_github_app_config_cached(verbose=True)
     if not is_valid:
         if error_type == "config_missing":
             click.echo("Error: GitHub App configuration not found. Please set the required environment variables.", err=True)
@@ -120,6 +129,7 @@ def serve(
             click.echo("  - GITHUB_APP_ID", err=True)
             click.echo("  - GITHUB_APP_PRIVATE_KEY_PATH", err=True)
             click.echo("  - GITHUB_APP_INSTALLATION_ID", err=True)
+            click.echo("  - GITHUB_BOT_NAME", err=True)
         elif error_type == "installation_not_found":
             click.echo("Error: GitHub App installation not found (404).", err=True)
             click.echo("This usually means:", err=True)
@@ -199,6 +209,8 @@ def serve(
     print("\nPress Ctrl+C to stop the server\n")
     
     # Import here to avoid loading Flask unless needed
+    import threading
+    
     from codebot.server.webhook import review_queue
     from codebot.server.review_processor import ReviewProcessor
     from codebot.server.task_queue import TaskQueue
@@ -219,6 +231,7 @@ def serve(
             review_queue=review_queue,
             workspace_base_dir=work_base_dir,
             github_app_auth=github_app_auth,
+            max_workers=review_workers,
         )
         
         review_processor_thread = threading.Thread(target=review_processor.start, daemon=True)
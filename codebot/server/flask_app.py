@@ -5,6 +5,7 @@ from typing import Optional, TYPE_CHECKING
 
 from flask import Flask, jsonify
 
+from codebot.server.json_provider import install_json_provider
 from codebot.server.task_queue import TaskQueue
 from codebot.server.webhook import review_queue
 
@@ -40,6 +41,7 @@ def create_app(
         template_folder=str(template_dir),
         static_folder=str(static_dir)
     )
+    install_json_provider(app)
     
     if bot_login:
         app.config['CODEBOT_BOT_LOGIN'] = bot_login
@@ -53,6 +55,8 @@ def create_app(
     if enable_webhook:
         from codebot.server import webhook
         
+        webhook._reload_secret()
+        
         app.add_url_rule(
             "/webhook",
             "handle_webhook",
@@ -97,6 +101,10 @@ def start_server(app: Flask, port: int = 5000, debug: bool = False):
     """
     Start the Flask server.
     
+    Requests are served on a thread each, so webhooks, API calls and open SSE log
+    streams do not block each other. The server stays a single process because the
+    task queue, review queue and live log storage are in-process state.
+    
     Args:
         app: Flask application instance
         port: Port to listen on
@@ -106,6 +114,7 @@ def start_server(app: Flask, port: int = 5000, debug: bool = False):
         host="0.0.0.0",
         port=port,
         debug=debug,
+        threaded=True,
         use_reloader=debug,
         reloader_type='stat' if debug else None
     )
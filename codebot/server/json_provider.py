@@ -0,0 +1,63 @@
+"""JSON serialization for server responses, using orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        JSON string (compact when orjson is available)
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that delegates to orjson for plain dumps/loads calls."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # jsonify asks for compact separators, which is what orjson writes anyway.
+        # Pretty-printing (debug mode) and other stdlib-only options keep the default path.
+        if kwargs and kwargs != {"separators": (",", ":")}:
+            return super().dumps(obj, **kwargs)
+        
+        # Datetimes go through self.default so they stay HTTP dates, as with the default provider
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects what the stdlib accepts, such as integers wider than 64 bits
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def install_json_provider(app: Flask) -> None:
+    """
+    Use orjson for the app's jsonify and request.get_json, if orjson is installed.
+    
+    Args:
+        app: Flask application instance
+    """
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
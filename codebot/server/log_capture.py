@@ -1,57 +1,221 @@
 """Log capture and storage system for task execution logs."""
 
+import atexit
+import queue
 import sys
 import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from typing import Deque, List, Optional, Dict, Tuple
 
 from codebot.core.storage import TaskStorage
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recently formatted second
+_second_prefix = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    Format the current UTC time like datetime.utcnow().isoformat().
+    
+    The date and time part is formatted once per second and reused, so a burst of
+    log lines only pays for the microsecond suffix.
+    
+    Returns:
+        ISO 8601 timestamp with microseconds
+    """
+    global _second_prefix
+    now = time.time()
+    second = int(now)
+    cached = _second_prefix
+    if cached[0] != second:
+        cached = _second_prefix = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+    return f"{cached[1]}.{int((now - second) * 1_000_000):06d}"
+
+
+class LogSubscription:
+    """Queue of new log lines for one live viewer of a task."""
+    
+    def __init__(self, backlog: List[Dict[str, str]], source_filter: Optional[str], maxsize: int):
+        """
+        Initialize the subscription.
+        
+        Args:
+            backlog: Lines already stored when the viewer subscribed
+            source_filter: Only queue lines from this source
+            maxsize: Maximum number of undelivered lines before new ones are dropped
+        """
+        self.backlog = backlog
+        self.source_filter = source_filter
+        self.queue: "queue.Queue[Optional[Dict[str, str]]]" = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self.closed = False
+    
+    def put(self, log_entry: Dict[str, str]) -> None:
+        if self.source_filter and log_entry["source"] != self.source_filter:
+            return
+        try:
+            self.queue.put_nowait(log_entry)
+        except queue.Full:
+            self.dropped += 1
+    
+    def close(self) -> None:
+        self.closed = True
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+
+class _TaskLogs:
+    """In-memory log lines of one task, bounded by line count and by total message size."""
+    
+    __slots__ = ("lines", "size", "truncated")
+    
+    def __init__(self):
+        self.lines: Deque[Dict[str, str]] = deque()
+        self.size = 0
+        self.truncated = 0
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def append(self, log_entry: Dict[str, str], max_lines: int, max_bytes: int) -> None:
+        """
+        Append a line, evicting the oldest lines while either limit is exceeded.
+        
+        The newest line is always kept, even if it alone exceeds max_bytes.
+        
+        Args:
+            log_entry: Log entry to append
+            max_lines: Maximum number of lines to keep
+            max_bytes: Maximum total length of the kept messages
+        """
+        lines = self.lines
+        lines.append(log_entry)
+        self.size += len(log_entry["message"])
+        while len(lines) > max_lines or (self.size > max_bytes and len(lines) > 1):
+            self.size -= len(lines.popleft()["message"])
+            self.truncated += 1
+    
+    def snapshot(self, source_filter: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Copy the kept lines, preceded by a marker line if older lines were evicted.
+        
+        Args:
+            source_filter: Only return lines from this source
+            
+        Returns:
+            List of log entries
+        """
+        if source_filter:
+            entries = [log for log in self.lines if log["source"] == source_filter]
+        else:
+            entries = list(self.lines)
+        
+        if self.truncated and source_filter in (None, "codebot"):
+            entries.insert(0, {
+                "timestamp": self.lines[0]["timestamp"],
+                "source": "codebot",
+                "message": f"[{self.truncated} earlier log lines truncated]",
+            })
+        return entries
+
 
 class LogStorage:
     """Thread-safe log storage for in-memory (running tasks) and database persistence."""
     
-    def __init__(self, storage: Optional[TaskStorage] = None, max_log_lines: int = 10000):
+    persist_batch_size = 32
+    persist_flush_interval = 0.25
+    persist_attempts = 2
+    
+    def __init__(
+        self,
+        storage: Optional[TaskStorage] = None,
+        max_log_lines: int = 10000,
+        max_log_bytes_per_task: int = 8 * 1024 * 1024,
+        storage_lock: Optional[threading.Lock] = None,
+    ):
         """
         Initialize log storage.
         
         Args:
             storage: Optional TaskStorage instance for persistence
             max_log_lines: Maximum number of log lines per task
+            max_log_bytes_per_task: Maximum total message length kept in memory per task
+            storage_lock: Lock that serializes access to storage with its other users
+                (TaskStore.lock for the shared task store)
         """
         self.storage = storage
+        self._storage_lock = storage_lock or threading.Lock()
         self.max_log_lines = max_log_lines
-        self._logs: Dict[str, List[Dict[str, str]]] = {}
+        self.max_log_bytes_per_task = max_log_bytes_per_task
+        self._logs: Dict[str, _TaskLogs] = {}
+        self._subscribers: Dict[str, List[LogSubscription]] = {}
         self._lock = threading.Lock()
+        self._persist_queue: "queue.Queue[Tuple[str, _TaskLogs]]" = queue.Queue(maxsize=1024)
+        self._persist_thread: Optional[threading.Thread] = None
     
     def add_log(self, task_id: str, source: str, message: str) -> None:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "source": source,
             "message": message
         }
         
         with self._lock:
-            if task_id not in self._logs:
-                self._logs[task_id] = []
+            logs = self._logs.get(task_id)
+            if logs is None:
+                logs = self._logs[task_id] = _TaskLogs()
+            logs.append(log_entry, self.max_log_lines, self.max_log_bytes_per_task)
             
-            logs = self._logs[task_id]
-            logs.append(log_entry)
-            
-            if len(logs) > self.max_log_lines:
-                logs.pop(0)
+            for subscription in self._subscribers.get(task_id, ()):
+                subscription.put(log_entry)
     
     def get_logs(self, task_id: str, source_filter: Optional[str] = None) -> List[Dict[str, str]]:
         with self._lock:
-            logs = self._logs.get(task_id, [])
-            if source_filter:
-                return [log for log in logs if log["source"] == source_filter]
-            return logs.copy()
+            logs = self._logs.get(task_id)
+            return logs.snapshot(source_filter) if logs else []
+    
+    def subscribe(self, task_id: str, source_filter: Optional[str] = None) -> LogSubscription:
+        """
+        Subscribe to new log lines of a running task.
+        
+        The current lines are snapshotted into the subscription's backlog under the same
+        lock that registers it, so no line is missed or delivered twice.
+        
+        Args:
+            task_id: Task ID
+            source_filter: Only deliver lines from this source
+            
+        Returns:
+            Subscription whose queue receives each new line, then None once the
+            task's logs are persisted
+        """
+        with self._lock:
+            logs = self._logs.get(task_id)
+            backlog = logs.snapshot(source_filter) if logs else []
+            subscription = LogSubscription(backlog, source_filter, maxsize=self.max_log_lines)
+            self._subscribers.setdefault(task_id, []).append(subscription)
+        return subscription
+    
+    def unsubscribe(self, task_id: str, subscription: LogSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(task_id)
+            if subscribers and subscription in subscribers:
+                subscribers.remove(subscription)
+                if not subscribers:
+                    del self._subscribers[task_id]
     
     def persist_logs(self, task_id: str) -> None:
         """
         Persist logs to database and remove from memory.
         
+        The write is handed to a background worker that batches several tasks per
+        database transaction. Logs stay readable from memory until they are written.
+        When the worker is backed up, the write happens on the calling thread.
+        
         Args:
             task_id: Task ID
         """
@@ -59,15 +223,104 @@ class LogStorage:
             return
         
         with self._lock:
-            logs = self._logs.get(task_id, [])
+            for subscription in self._subscribers.pop(task_id, ()):
+                subscription.close()
+            
+            logs = self._logs.get(task_id)
             if not logs:
                 return
+        
+        self._ensure_persist_worker()
+        try:
+            self._persist_queue.put_nowait((task_id, logs))
+        except queue.Full:
+            self._persist_batch([(task_id, logs)])
+    
+    def flush(self) -> None:
+        """Block until every log write handed to the background worker has finished."""
+        if self._persist_thread is not None:
+            self._persist_queue.join()
+    
+    def _ensure_persist_worker(self) -> None:
+        with self._lock:
+            if self._persist_thread is not None:
+                return
+            self._persist_thread = threading.Thread(
+                target=self._persist_worker,
+                name="log-persist",
+                daemon=True,
+            )
+            self._persist_thread.start()
+        # Daemon threads are killed at exit, so drain pending writes first
+        atexit.register(self.flush)
+    
+    def _persist_worker(self) -> None:
+        while True:
+            batch = [self._persist_queue.get()]
+            deadline = time.monotonic() + self.persist_flush_interval
+            while len(batch) < self.persist_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._persist_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
             
-            if hasattr(self.storage, 'update_task_logs'):
-                self.storage.update_task_logs(task_id, logs)
-            
-            if task_id in self._logs:
-                del self._logs[task_id]
+            try:
+                self._persist_batch(batch)
+            finally:
+                for _ in batch:
+                    self._persist_queue.task_done()
+    
+    def _persist_batch(self, batch: List[Tuple[str, _TaskLogs]]) -> None:
+        """
+        Write a batch of task logs, retrying a failed write before giving up on it.
+        
+        A batch that still fails after persist_attempts writes is dropped: its logs
+        are removed from memory so the buffers do not outlive their tasks.
+        
+        Args:
+            batch: (task ID, in-memory log buffer) pairs
+        """
+        for attempt in range(1, self.persist_attempts + 1):
+            try:
+                self._write_logs(batch)
+                return
+            except Exception as e:
+                error = e
+                if attempt < self.persist_attempts:
+                    time.sleep(self.persist_flush_interval)
+        
+        task_ids = ", ".join(task_id for task_id, _ in batch)
+        print(f"ERROR: Dropping logs of task(s) {task_ids} after {self.persist_attempts} failed writes: {error}")
+        self._retire(batch)
+    
+    def _write_logs(self, batch: List[Tuple[str, _TaskLogs]]) -> None:
+        """
+        Write the logs of several tasks to storage and drop them from memory.
+        
+        Args:
+            batch: (task ID, in-memory log buffer) pairs
+        """
+        with self._lock:
+            entries = [(task_id, logs.snapshot()) for task_id, logs in batch]
+        
+        with self._storage_lock:
+            if hasattr(self.storage, 'update_task_logs_batch'):
+                self.storage.update_task_logs_batch(entries)
+            elif hasattr(self.storage, 'update_task_logs'):
+                for task_id, task_logs in entries:
+                    self.storage.update_task_logs(task_id, task_logs)
+        
+        self._retire(batch)
+    
+    def _retire(self, batch: List[Tuple[str, _TaskLogs]]) -> None:
+        """Remove the given log buffers from memory, unless a task has started a new one."""
+        with self._lock:
+            for task_id, logs in batch:
+                if self._logs.get(task_id) is logs:
+                    del self._logs[task_id]
     
     def has_logs(self, task_id: str) -> bool:
         with self._lock:
@@ -84,7 +337,12 @@ class LogStorage:
             return
         
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
-        self.storage.cleanup_old_logs(cutoff_date)
+        with self._storage_lock:
+            self.storage.cleanup_old_logs(cutoff_date)
+
+
+# A line longer than this without a newline is logged in pieces
+MAX_PARTIAL_LINE = 64 * 1024
 
 
 class LogStreamWriter:
@@ -95,7 +353,9 @@ class LogStreamWriter:
         self.task_id = task_id
         self.source = source
         self.original_stream = original_stream
-        self._buffer = ""
+        # Pieces of the current unterminated line, joined only once a newline arrives
+        self._parts: List[str] = []
+        self._partial_len = 0
     
     def write(self, message: str) -> int:
         if not message:
@@ -104,9 +364,21 @@ class LogStreamWriter:
         self.original_stream.write(message)
         self.original_stream.flush()
         
-        self._buffer += message
-        lines = self._buffer.split('\n')
-        self._buffer = lines[-1]
+        if "\n" not in message:
+            self._parts.append(message)
+            self._partial_len += len(message)
+            if self._partial_len > MAX_PARTIAL_LINE:
+                self.flush()
+                if self._parts:
+                    # Nothing but whitespace so far; not worth keeping
+                    self._parts = []
+                    self._partial_len = 0
+            return len(message)
+        
+        self._parts.append(message)
+        lines = "".join(self._parts).split('\n')
+        self._parts = [lines[-1]] if lines[-1] else []
+        self._partial_len = len(lines[-1])
         
         for line in lines[:-1]:
             if line.strip():
@@ -116,9 +388,16 @@ class LogStreamWriter:
     
     def flush(self) -> None:
         self.original_stream.flush()
-        if self._buffer.strip():
-            self.log_storage.add_log(self.task_id, self.source, self._buffer.rstrip('\n\r'))
-            self._buffer = ""
+        if not self._parts:
+            return
+        
+        buffer = "".join(self._parts)
+        if buffer.strip():
+            self.log_storage.add_log(self.task_id, self.source, buffer.rstrip('\n\r'))
+            self._parts = []
+            self._partial_len = 0
+        else:
+            self._parts = [buffer]
 
 
 class LogCapture:
@@ -152,27 +431,42 @@ class LogCapture:
         return False
     
     def write(self, message: str) -> None:
-        if message:
-            for line in message.splitlines():
-                if line.strip():
-                    self.log_storage.add_log(self.task_id, self.source, line)
+        """
+        Add already line-oriented output (e.g. a subprocess's lines) directly to log storage.
+        
+        Args:
+            message: One line, or several separated by newlines
+        """
+        if "\n" not in message and "\r" not in message:
+            # Callers usually pass a single stripped line
+            if message.strip():
+                self.log_storage.add_log(self.task_id, self.source, message)
+            return
+        
+        for line in message.splitlines():
+            if line.strip():
+                self.log_storage.add_log(self.task_id, self.source, line)
 
 
 global_log_storage: Optional[LogStorage] = None
 
 
-def get_log_storage(storage: Optional[TaskStorage] = None) -> LogStorage:
+def get_log_storage(
+    storage: Optional[TaskStorage] = None,
+    storage_lock: Optional[threading.Lock] = None,
+) -> LogStorage:
     """
     Get or create global log storage instance.
     
     Args:
         storage: Optional TaskStorage instance (only used on first call)
+        storage_lock: Lock guarding storage for its other users (only used on first call)
         
     Returns:
         LogStorage instance
     """
     global global_log_storage
     if global_log_storage is None:
-        global_log_storage = LogStorage(storage=storage)
+        global_log_storage = LogStorage(storage=storage, storage_lock=storage_lock)
     return global_log_storage
 
@@ -3,12 +3,13 @@
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from queue import Queue
+from queue import SimpleQueue
 from typing import Optional
 from urllib.parse import urlparse
 
 from codebot.core.github_app import GitHubAppAuth
 from codebot.core.github_pr import GitHubPR
+from codebot.core.models import ReviewEvent
 from codebot.core.task_store import global_task_store
 from codebot.core.utils import cleanup_pr_workspace
 
@@ -18,7 +19,7 @@ class GitHubPoller:
     
     def __init__(
         self,
-        review_queue: Queue,
+        review_queue: SimpleQueue,
         workspace_base_dir: Path,
         github_app_auth: GitHubAppAuth,
         poll_interval: int = 300,
@@ -310,27 +311,26 @@ class GitHubPoller:
             pr_title = ""
             pr_body = ""
         
-        comment_data = {
-            "type": comment_type,
-            "comment_id": comment_id,
-            "comment_body": comment.get("body", ""),
-            "pr_number": pr_number,
-            "pr_title": pr_title,
-            "pr_body": pr_body,
-            "branch_name": branch_name,
-            "repo_url": task.prompt.repository_url,
-            "repo_owner": repo_owner,
-            "repo_name": repo_name,
-        }
-        
-        if comment_type == "review_comment":
-            comment_data["comment_path"] = comment.get("path")
-            comment_data["comment_line"] = comment.get("line")
-            comment_data["comment_diff_hunk"] = comment.get("diff_hunk", "")
-            comment_data["in_reply_to_id"] = comment.get("in_reply_to_id")
+        # Issue comments carry no path/line/diff_hunk, so these stay at their defaults for them
+        event = ReviewEvent(
+            type=comment_type,
+            comment_id=comment_id,
+            comment_body=comment.get("body", ""),
+            pr_number=pr_number,
+            pr_title=pr_title,
+            pr_body=pr_body,
+            branch_name=branch_name,
+            repo_url=task.prompt.repository_url,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            comment_path=comment.get("path"),
+            comment_line=comment.get("line"),
+            comment_diff_hunk=comment.get("diff_hunk", ""),
+            in_reply_to_id=comment.get("in_reply_to_id"),
+        )
         
         storage.mark_comment_processed(comment_id, repo_owner, repo_name, pr_number, comment_type)
-        self.review_queue.put(comment_data)
+        self.review_queue.put(event)
         
         print(f"Queued {comment_type} for PR #{pr_number} (comment ID: {comment_id})")
     
@@ -368,22 +368,22 @@ class GitHubPoller:
                 else "Changes requested"
             )
         
-        comment_data = {
-            "type": comment_type,
-            "comment_id": review_id,
-            "comment_body": review_body,
-            "pr_number": pr_number,
-            "pr_title": pr_title,
-            "pr_body": pr_body,
-            "branch_name": branch_name,
-            "repo_url": task.prompt.repository_url,
-            "repo_owner": repo_owner,
-            "repo_name": repo_name,
-            "review_state": review_state,
-        }
+        event = ReviewEvent(
+            type=comment_type,
+            comment_id=review_id,
+            comment_body=review_body,
+            pr_number=pr_number,
+            pr_title=pr_title,
+            pr_body=pr_body,
+            branch_name=branch_name,
+            repo_url=task.prompt.repository_url,
+            repo_owner=repo_owner,
+            repo_name=repo_name,
+            review_state=review_state,
+        )
         
         storage.mark_comment_processed(review_id, repo_owner, repo_name, pr_number, comment_type)
-        self.review_queue.put(comment_data)
+        self.review_queue.put(event)
         
         print(f"Queued review for PR #{pr_number} (review ID: {review_id})")
     
@@ -1,21 +1,26 @@
 """Process PR review comments from the queue."""
 
 import json
+import os
 import subprocess
+import threading
 import time
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from queue import Empty, Queue
-from typing import Optional
+from queue import Empty, SimpleQueue
+from typing import Dict, Optional, Tuple
 
 from codebot.core.environment import EnvironmentManager
 from codebot.core.github_app import GitHubAppAuth
 from codebot.core.git_ops import GitOps
 from codebot.core.github_pr import GitHubPR
-from codebot.core.models import Task, TaskPrompt
+from codebot.core.models import ReviewEvent, Task, TaskPrompt
 from codebot.core.task_store import global_task_store
 from codebot.server.review_runner import ReviewRunner
+from codebot.server.webhook import drain_batch
 from codebot.core.utils import extract_uuid_from_branch, find_workspace_by_uuid
 
 
@@ -24,66 +29,114 @@ class ReviewProcessor:
     
     def __init__(
         self,
-        review_queue: Queue,
+        review_queue: SimpleQueue,
         workspace_base_dir: Path,
         github_app_auth: GitHubAppAuth,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize the review processor.
         
         Args:
-            review_queue: Queue containing review comments to process
+            review_queue: Queue of ReviewEvents to process
             workspace_base_dir: Base directory for workspaces
             github_app_auth: GitHub App authentication instance
+            max_workers: Number of PRs processed concurrently (defaults to ~3/4 of the CPU count)
         """
         self.review_queue = review_queue
         self.workspace_base_dir = workspace_base_dir
         self.github_app_auth = github_app_auth
         self.github_pr = GitHubPR(github_app_auth)
+        self.max_workers = max_workers or max(2, (os.cpu_count() or 4) * 3 // 4)
         self.running = False
+        self._pending: Dict[Tuple, deque] = {}
+        self._pending_lock = threading.Lock()
     
     def start(self):
         self.running = True
         print("Review processor started")
         
-        while self.running:
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="review") as executor:
+            while self.running:
+                try:
+                    self._run_once(executor)
+                    
+                except Empty:
+                    continue
+                except KeyboardInterrupt:
+                    print("\nStopping review processor...")
+                    self.running = False
+                    break
+                except Exception as e:
+                    print(f"ERROR: Failed to process review comment: {e}")
+                    continue
+    
+    def _run_once(self, executor: ThreadPoolExecutor, timeout: float = 5) -> None:
+        """
+        Take the queued comments off the review queue and hand them to the worker pool.
+        
+        Args:
+            executor: Worker pool
+            timeout: Seconds to wait for a comment before raising queue.Empty
+        """
+        for event in drain_batch(self.review_queue, timeout=timeout):
+            self._dispatch(executor, event)
+    
+    def _dispatch(self, executor: ThreadPoolExecutor, event: ReviewEvent) -> None:
+        """
+        Hand a comment to the worker pool, keeping comments on the same PR in order.
+        
+        Comments for one PR share a workspace, so they are queued behind each other
+        and drained by a single worker; different PRs run in parallel.
+        
+        Args:
+            executor: Worker pool
+            event: Comment or review to process
+        """
+        key = (event.repo_owner, event.repo_name, event.pr_number)
+        
+        with self._pending_lock:
+            if key in self._pending:
+                self._pending[key].append(event)
+                return
+            self._pending[key] = deque([event])
+        
+        executor.submit(self._drain_pr, key)
+    
+    def _drain_pr(self, key: Tuple) -> None:
+        while True:
+            with self._pending_lock:
+                if not self._pending[key]:
+                    del self._pending[key]
+                    return
+                event = self._pending[key].popleft()
+            
             try:
-                comment_data = self.review_queue.get(timeout=5)
-                
                 print(f"\n{'=' * 80}")
-                print(f"Processing review comment for PR #{comment_data['pr_number']}")
+                print(f"Processing review comment for PR #{event.pr_number}")
                 print(f"{'=' * 80}\n")
                 
-                self.process_comment(comment_data)
-                self.review_queue.task_done()
-                
-            except Empty:
-                continue
-            except KeyboardInterrupt:
-                print("\nStopping review processor...")
-                self.running = False
-                break
+                self.process_comment(event)
             except Exception as e:
                 print(f"ERROR: Failed to process review comment: {e}")
-                continue
     
     def stop(self):
         self.running = False
     
-    def process_comment(self, comment_data: dict):
+    def process_comment(self, event: ReviewEvent):
         """
         Process a single review comment.
         
         Args:
-            comment_data: Dictionary with comment information
+            event: Comment or review to process
         """
-        pr_number = comment_data["pr_number"]
-        branch_name = comment_data.get("branch_name")
-        repo_url = comment_data["repo_url"]
-        repo_owner = comment_data["repo_owner"]
-        repo_name = comment_data["repo_name"]
-        comment_body = comment_data["comment_body"]
-        comment_id = comment_data["comment_id"]
+        pr_number = event.pr_number
+        branch_name = event.branch_name
+        repo_url = event.repo_url
+        repo_owner = event.repo_owner
+        repo_name = event.repo_name
+        comment_body = event.comment_body
+        comment_id = event.comment_id
         
         if not branch_name:
             print("Fetching branch name from PR details...")
@@ -136,12 +189,12 @@ class ReviewProcessor:
         
         pr_context = self._get_pr_context(repo_owner, repo_name, pr_number)
         
-        if comment_data.get("comment_path"):
-            pr_context["comment_file"] = comment_data.get("comment_path")
-            pr_context["comment_line"] = comment_data.get("comment_line")
-            pr_context["comment_diff_hunk"] = comment_data.get("comment_diff_hunk", "")
+        if event.comment_path:
+            pr_context["comment_file"] = event.comment_path
+            pr_context["comment_line"] = event.comment_line
+            pr_context["comment_diff_hunk"] = event.comment_diff_hunk
         
-        if comment_data.get("in_reply_to_id") or comment_data.get("type") == "review_comment":
+        if event.in_reply_to_id or event.type == "review_comment":
             print("Fetching comment thread...")
             thread = self.github_pr.get_comment_thread(repo_owner, repo_name, pr_number, comment_id)
             if thread and len(thread) > 1:
@@ -177,7 +230,7 @@ class ReviewProcessor:
                 repo_owner,
                 repo_name,
                 pr_number,
-                comment_data.get("type", "review_comment"),
+                event.type,
                 comment_id,
                 classification["clarification_question"],
             )
@@ -191,7 +244,7 @@ class ReviewProcessor:
                 repo_name,
                 pr_number,
                 comment_id,
-                comment_data.get("type", "review_comment"),
+                event.type,
                 reply_body,
             )
             return
@@ -205,7 +258,7 @@ class ReviewProcessor:
                 repo_name,
                 pr_number,
                 comment_id,
-                comment_data.get("type", "review_comment"),
+                event.type,
                 reply_body,
             )
             return
@@ -233,7 +286,7 @@ class ReviewProcessor:
                     repo_owner,
                     repo_name,
                     comment_id,
-                    comment_data["type"],
+                    event.type,
                     pr_number,
                 )
                 return
@@ -248,7 +301,7 @@ class ReviewProcessor:
                 repo_owner,
                 repo_name,
                 comment_id,
-                comment_data["type"],
+                event.type,
                 pr_number,
             )
             return
@@ -312,7 +365,7 @@ class ReviewProcessor:
                 "pr_number": pr_number,
                 "pr_url": f"https://github.com/{repo_owner}/{repo_name}/pull/{pr_number}",
                 "comment_id": comment_id,
-                "comment_type": comment_data.get("type", "review_comment"),
+                "comment_type": event.type,
                 "branch_name": branch_name,
             },
         )
@@ -337,7 +390,7 @@ class ReviewProcessor:
             repo_name,
             pr_number,
             comment_id,
-            comment_data.get("type", "review_comment"),
+            event.type,
             reply_body,
         )
     
@@ -8,6 +8,75 @@ from codebot.claude.runner import ClaudeRunner
 from codebot.core.github_app import GitHubAppAuth
 
 
+_SEP = "=" * 80
+
+_THREAD_HEADER = f"\n{_SEP}\nCOMMENT THREAD (Previous Conversation)\n{_SEP}\n"
+
+_REVIEW_PROMPT_TEMPLATE = (
+    f"{_SEP}\n"
+    "CODE REVIEW CONTEXT\n"
+    f"{_SEP}\n"
+    "\n"
+    "You are responding to a code review comment on a pull request.\n"
+    "\n"
+    "{pr_title_section}"
+    "{pr_body_section}"
+    "{files_section}"
+    "{location_section}"
+    "{thread_section}"
+    "\n"
+    f"{_SEP}\n"
+    "CURRENT REVIEW COMMENT\n"
+    f"{_SEP}\n"
+    "\n"
+    "{comment_body}\n"
+    "\n"
+    f"{_SEP}\n"
+    "{instructions}"
+)
+
+_CHANGE_INSTRUCTIONS = "\n".join([
+    "",
+    "This is a CHANGE REQUEST. You should:",
+    "1. Understand what changes are being requested",
+    "2. Make the necessary code changes",
+    "3. Test the changes to ensure they work",
+    "4. Run all tests to ensure nothing is broken",
+    "5. Commit the changes with a clear message",
+    "",
+    "**CRITICAL COMMIT MESSAGE REQUIREMENTS:**",
+    "- Your commit message should reference that this addresses a review comment",
+    "- **DO NOT include any of the following in your commit messages:**",
+    "  * \"🤖 Generated with Claude Code\" or any variation of this text",
+    "  * \"Co-Authored-By:\" trailers or any author attribution lines",
+    "  * Any text that mentions Claude Code or Claude as an author",
+    "",
+    "RESPONSE FORMAT:",
+    "Provide a CONCISE, scannable summary. NO pleasantries or preambles.",
+    "Format:",
+    "✅ [One-line summary of what was done]",
+    "",
+    "**Changes:**",
+    "- [Specific change 1]",
+    "- [Specific change 2]",
+    "",
+    "**Results:** [Brief test/verification results]",
+])
+
+_QUERY_INSTRUCTIONS = "\n".join([
+    "",
+    "This is a QUERY/QUESTION. You should:",
+    "1. Understand what is being asked",
+    "2. Provide a CONCISE but SUFFICIENT answer",
+    "3. Be direct and to the point",
+    "4. Reference specific code or files if relevant",
+    "5. DO NOT make any code changes",
+    "",
+    "IMPORTANT: Keep your answer brief and focused. Avoid unnecessary elaboration.",
+    "Your response will be posted as a comment reply.",
+])
+
+
 class ReviewRunner:
     """Runner for Claude Code CLI specialized for PR review comments."""
     
@@ -101,99 +170,43 @@ class ReviewRunner:
         Returns:
             System prompt string
         """
-        prompt_parts = []
-        
-        # Context about the review
-        prompt_parts.append("=" * 80)
-        prompt_parts.append("CODE REVIEW CONTEXT")
-        prompt_parts.append("=" * 80)
-        prompt_parts.append("")
-        prompt_parts.append("You are responding to a code review comment on a pull request.")
-        prompt_parts.append("")
-        
-        # PR information
+        pr_title_section = ""
         if pr_context.get("pr_title"):
-            prompt_parts.append(f"PR Title: {pr_context['pr_title']}")
+            pr_title_section = f"PR Title: {pr_context['pr_title']}\n"
         
+        pr_body_section = ""
         if pr_context.get("pr_body"):
-            prompt_parts.append(f"\nOriginal Task Description:")
-            prompt_parts.append(pr_context['pr_body'])
+            pr_body_section = f"\nOriginal Task Description:\n{pr_context['pr_body']}\n"
         
+        files_section = ""
         if pr_context.get("files_changed"):
-            prompt_parts.append(f"\nFiles Changed in This PR:")
-            prompt_parts.append("```")
-            prompt_parts.append(pr_context['files_changed'])
-            prompt_parts.append("```")
+            files_section = f"\nFiles Changed in This PR:\n```\n{pr_context['files_changed']}\n```\n"
         
+        location_section = ""
         if pr_context.get("comment_file"):
-            prompt_parts.append(f"\nComment Location:")
-            prompt_parts.append(f"- File: {pr_context.get('comment_file')}")
-            prompt_parts.append(f"- Line: {pr_context.get('comment_line')}")
-            
+            location_section = (
+                f"\nComment Location:\n"
+                f"- File: {pr_context.get('comment_file')}\n"
+                f"- Line: {pr_context.get('comment_line')}\n"
+            )
             if pr_context.get("comment_diff_hunk"):
-                prompt_parts.append(f"\nCode Being Reviewed:")
-                prompt_parts.append("```")
-                prompt_parts.append(pr_context.get('comment_diff_hunk'))
-                prompt_parts.append("```")
+                location_section += f"\nCode Being Reviewed:\n```\n{pr_context.get('comment_diff_hunk')}\n```\n"
         
+        thread_section = ""
         if pr_context.get("comment_thread"):
-            prompt_parts.append("")
-            prompt_parts.append("=" * 80)
-            prompt_parts.append("COMMENT THREAD (Previous Conversation)")
-            prompt_parts.append("=" * 80)
+            thread_section = _THREAD_HEADER
             for i, thread_comment in enumerate(pr_context['comment_thread'][:-1], 1):
                 author = thread_comment.get('user', {}).get('login', 'Unknown')
                 body = thread_comment.get('body', '')
-                prompt_parts.append(f"\n{i}. {author}:")
-                prompt_parts.append(body)
+                thread_section += f"\n{i}. {author}:\n{body}\n"
         
-        prompt_parts.append("")
-        prompt_parts.append("=" * 80)
-        prompt_parts.append("CURRENT REVIEW COMMENT")
-        prompt_parts.append("=" * 80)
-        prompt_parts.append("")
-        prompt_parts.append(comment_body)
-        prompt_parts.append("")
-        prompt_parts.append("=" * 80)
-        
-        # Instructions based on comment type
-        if is_change_request:
-            prompt_parts.append("")
-            prompt_parts.append("This is a CHANGE REQUEST. You should:")
-            prompt_parts.append("1. Understand what changes are being requested")
-            prompt_parts.append("2. Make the necessary code changes")
-            prompt_parts.append("3. Test the changes to ensure they work")
-            prompt_parts.append("4. Run all tests to ensure nothing is broken")
-            prompt_parts.append("5. Commit the changes with a clear message")
-            prompt_parts.append("")
-            prompt_parts.append("**CRITICAL COMMIT MESSAGE REQUIREMENTS:**")
-            prompt_parts.append("- Your commit message should reference that this addresses a review comment")
-            prompt_parts.append("- **DO NOT include any of the following in your commit messages:**")
-            prompt_parts.append("  * \"🤖 Generated with Claude Code\" or any variation of this text")
-            prompt_parts.append("  * \"Co-Authored-By:\" trailers or any author attribution lines")
-            prompt_parts.append("  * Any text that mentions Claude Code or Claude as an author")
-            prompt_parts.append("")
-            prompt_parts.append("RESPONSE FORMAT:")
-            prompt_parts.append("Provide a CONCISE, scannable summary. NO pleasantries or preambles.")
-            prompt_parts.append("Format:")
-            prompt_parts.append("✅ [One-line summary of what was done]")
-            prompt_parts.append("")
-            prompt_parts.append("**Changes:**")
-            prompt_parts.append("- [Specific change 1]")
-            prompt_parts.append("- [Specific change 2]")
-            prompt_parts.append("")
-            prompt_parts.append("**Results:** [Brief test/verification results]")
-        else:
-            prompt_parts.append("")
-            prompt_parts.append("This is a QUERY/QUESTION. You should:")
-            prompt_parts.append("1. Understand what is being asked")
-            prompt_parts.append("2. Provide a CONCISE but SUFFICIENT answer")
-            prompt_parts.append("3. Be direct and to the point")
-            prompt_parts.append("4. Reference specific code or files if relevant")
-            prompt_parts.append("5. DO NOT make any code changes")
-            prompt_parts.append("")
-            prompt_parts.append("IMPORTANT: Keep your answer brief and focused. Avoid unnecessary elaboration.")
-            prompt_parts.append("Your response will be posted as a comment reply.")
-        
-        return "\n".join(prompt_parts)
+        return _REVIEW_PROMPT_TEMPLATE.format(
+            pr_title_section=pr_title_section,
+            pr_body_section=pr_body_section,
+            files_section=files_section,
+            location_section=location_section,
+            thread_section=thread_section,
+            comment_body=comment_body,
+            instructions=_CHANGE_INSTRUCTIONS if is_change_request else _QUERY_INSTRUCTIONS,
+        )
 
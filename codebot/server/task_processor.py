@@ -101,7 +101,7 @@ class TaskProcessor:
             started_at=datetime.utcnow()
         )
         
-        log_storage = get_log_storage(storage=global_task_store.storage)
+        log_storage = get_log_storage(storage=global_task_store.storage, storage_lock=global_task_store.lock)
         log_capture = LogCapture(log_storage, task_id, "codebot")
         
         try:
@@ -1,18 +1,62 @@
 """Web UI routes for task management."""
 
-import json
+import math
+import queue
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Optional
 
-import requests
 from flask import Blueprint, Response, render_template, jsonify, request, current_app, stream_with_context
 
+from codebot.core.github_app import get_github_session
 from codebot.core.models import Task, TaskPrompt
 from codebot.core.task_store import global_task_store
 from codebot.server.auth import require_basic_auth, require_auth
+from codebot.server.json_provider import dumps
 from codebot.server.log_capture import get_log_storage
 
 
+def _serialize_task_list(task: Task) -> dict:
+    """Serialize a task (and its subtasks) for the task list."""
+    return {
+        "id": task.id,
+        "source": task.source,
+        "status": task.status,
+        "repository_url": task.prompt.repository_url,
+        "description": task.prompt.description,
+        "ticket_id": task.prompt.ticket_id,
+        "ticket_summary": task.prompt.ticket_summary,
+        "submitted_at": task.submitted_at.isoformat() if task.submitted_at else None,
+        "started_at": task.started_at.isoformat() if task.started_at else None,
+        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+        "result": task.result,
+        "error": task.error,
+        "subtasks": [_serialize_task_list(st) for st in task.subtasks] if task.subtasks else [],
+    }
+
+
+def _serialize_task_detail(task: Task) -> dict:
+    """Serialize a task (and its subtasks) for the task detail view."""
+    return {
+        "id": task.id,
+        "source": task.source,
+        "status": task.status,
+        "repository_url": task.prompt.repository_url,
+        "description": task.prompt.description,
+        "ticket_id": task.prompt.ticket_id,
+        "ticket_summary": task.prompt.ticket_summary,
+        "test_command": task.prompt.test_command,
+        "base_branch": task.prompt.base_branch,
+        "submitted_at": task.submitted_at.isoformat() if task.submitted_at else None,
+        "started_at": task.started_at.isoformat() if task.started_at else None,
+        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+        "result": task.result,
+        "error": task.error,
+        "subtasks": [_serialize_task_detail(st) for st in task.subtasks] if task.subtasks else [],
+    }
+
+
 def create_web_ui_blueprint() -> Blueprint:
     """
     Create web UI blueprint with task management routes.
@@ -48,25 +92,8 @@ def create_web_ui_blueprint() -> Blueprint:
         
         tasks = [t for t in tasks if t.source != "review"]
         
-        def serialize_task(task: Task) -> dict:
-            return {
-                "id": task.id,
-                "source": task.source,
-                "status": task.status,
-                "repository_url": task.prompt.repository_url,
-                "description": task.prompt.description,
-                "ticket_id": task.prompt.ticket_id,
-                "ticket_summary": task.prompt.ticket_summary,
-                "submitted_at": task.submitted_at.isoformat() if task.submitted_at else None,
-                "started_at": task.started_at.isoformat() if task.started_at else None,
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "result": task.result,
-                "error": task.error,
-                "subtasks": [serialize_task(st) for st in task.subtasks] if task.subtasks else [],
-            }
-        
         return jsonify({
-            "tasks": [serialize_task(task) for task in tasks],
+            "tasks": [_serialize_task_list(task) for task in tasks],
             "count": len(tasks)
         }), 200
     
@@ -81,26 +108,7 @@ def create_web_ui_blueprint() -> Blueprint:
                 "message": f"Task {task_id} not found"
             }), 404
         
-        def serialize_task(task: Task) -> dict:
-            return {
-                "id": task.id,
-                "source": task.source,
-                "status": task.status,
-                "repository_url": task.prompt.repository_url,
-                "description": task.prompt.description,
-                "ticket_id": task.prompt.ticket_id,
-                "ticket_summary": task.prompt.ticket_summary,
-                "test_command": task.prompt.test_command,
-                "base_branch": task.prompt.base_branch,
-                "submitted_at": task.submitted_at.isoformat() if task.submitted_at else None,
-                "started_at": task.started_at.isoformat() if task.started_at else None,
-                "completed_at": task.completed_at.isoformat() if task.completed_at else None,
-                "result": task.result,
-                "error": task.error,
-                "subtasks": [serialize_task(st) for st in task.subtasks] if task.subtasks else [],
-            }
-        
-        return jsonify(serialize_task(task)), 200
+        return jsonify(_serialize_task_detail(task)), 200
     
     @web_ui.route("/api/web/tasks/<task_id>/retry", methods=["POST"])
     @require_basic_auth
@@ -174,39 +182,44 @@ def create_web_ui_blueprint() -> Blueprint:
             headers = github_app_auth.get_auth_headers()
             
             url = f"{api_url}/installation/repositories"
-            repositories = []
-            page = 1
             per_page = 100
             
-            while True:
-                params = {"per_page": per_page, "page": page}
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-                
+            def fetch_page(page: int) -> Optional[list]:
+                # Runs on pool threads, which each use their own session
+                response = get_github_session().get(url, headers=headers, params={"per_page": per_page, "page": page}, timeout=10)
                 if response.status_code != 200:
-                    if page == 1:
-                        return jsonify({
-                            "repositories": [],
-                            "error": f"GitHub API error: {response.status_code}"
-                        }), 200
-                    break
-                
-                data = response.json()
-                repos = data.get("repositories", [])
-                
-                if not repos:
-                    break
-                
-                for repo in repos:
-                    repositories.append({
-                        "full_name": repo.get("full_name", ""),
-                        "html_url": repo.get("html_url", ""),
-                        "clone_url": repo.get("clone_url", ""),
-                    })
-                
-                if len(repos) < per_page:
-                    break
-                
-                page += 1
+                    return None
+                return response.json().get("repositories", [])
+            
+            response = get_github_session().get(url, headers=headers, params={"per_page": per_page, "page": 1}, timeout=10)
+            
+            if response.status_code != 200:
+                return jsonify({
+                    "repositories": [],
+                    "error": f"GitHub API error: {response.status_code}"
+                }), 200
+            
+            data = response.json()
+            pages = [data.get("repositories", [])]
+            
+            # The first page reports the total, so the rest can be fetched concurrently
+            num_pages = math.ceil(data.get("total_count", 0) / per_page)
+            if num_pages > 1 and len(pages[0]) == per_page:
+                with ThreadPoolExecutor(max_workers=min(8, num_pages - 1)) as executor:
+                    for repos in executor.map(fetch_page, range(2, num_pages + 1)):
+                        if not repos:
+                            break
+                        pages.append(repos)
+            
+            repositories = [
+                {
+                    "full_name": repo.get("full_name", ""),
+                    "html_url": repo.get("html_url", ""),
+                    "clone_url": repo.get("clone_url", ""),
+                }
+                for repos in pages
+                for repo in repos
+            ]
             
             return jsonify({
                 "repositories": repositories,
@@ -311,34 +324,59 @@ def create_web_ui_blueprint() -> Blueprint:
         source_filter = request.args.get("source")
         
         def generate():
-            import time
-            log_storage = get_log_storage(storage=global_task_store.storage)
-            last_index = 0
+            log_storage = get_log_storage(storage=global_task_store.storage, storage_lock=global_task_store.lock)
             
             if task.status == "running":
-                while True:
-                    logs = log_storage.get_logs(task_id, source_filter=source_filter)
-                    if len(logs) > last_index:
-                        for log_entry in logs[last_index:]:
-                            yield f"data: {json.dumps(log_entry)}\n\n"
-                        last_index = len(logs)
-                    
-                    current_task = global_task_store.get_task(task_id)
-                    if not current_task or current_task.status != "running":
-                        break
+                subscription = log_storage.subscribe(task_id, source_filter=source_filter)
+                try:
+                    for log_entry in subscription.backlog:
+                        yield f"data: {dumps(log_entry)}\n\n"
+                    subscription.backlog = []
                     
-                    time.sleep(0.5)
+                    dropped = 0
+                    while True:
+                        try:
+                            log_entry = subscription.queue.get(timeout=15.0)
+                        except queue.Empty:
+                            if subscription.closed:
+                                break
+                            
+                            # Keep proxies from dropping the idle connection
+                            yield ": ping\n\n"
+                            
+                            current_task = global_task_store.get_task(task_id)
+                            if not current_task or current_task.status != "running":
+                                break
+                            continue
+                        
+                        if log_entry is None:
+                            break
+                        
+                        yield f"data: {dumps(log_entry)}\n\n"
+                        
+                        # Lines are only dropped while the queue is full, so the gap sits
+                        # after everything that was queued at that point
+                        if subscription.dropped != dropped and subscription.queue.empty():
+                            notice = {
+                                "timestamp": log_entry["timestamp"],
+                                "source": log_entry["source"],
+                                "message": f"[{subscription.dropped - dropped} log lines dropped]",
+                            }
+                            dropped = subscription.dropped
+                            yield f"data: {dumps(notice)}\n\n"
+                finally:
+                    log_storage.unsubscribe(task_id, subscription)
             else:
                 if task.logs:
                     logs = task.logs
                     if source_filter:
                         logs = [log for log in logs if log.get("source") == source_filter]
                     for log_entry in logs:
-                        yield f"data: {json.dumps(log_entry)}\n\n"
+                        yield f"data: {dumps(log_entry)}\n\n"
                 else:
                     logs = log_storage.get_logs(task_id, source_filter=source_filter)
                     for log_entry in logs:
-                        yield f"data: {json.dumps(log_entry)}\n\n"
+                        yield f"data: {dumps(log_entry)}\n\n"
             
             yield "data: {\"type\": \"done\"}\n\n"
         
@@ -368,7 +406,7 @@ def create_web_ui_blueprint() -> Blueprint:
         if task.logs:
             logs = task.logs
         else:
-            log_storage = get_log_storage(storage=global_task_store.storage)
+            log_storage = get_log_storage(storage=global_task_store.storage, storage_lock=global_task_store.lock)
             logs = log_storage.get_logs(task_id, source_filter=source_filter)
         
         if source_filter:
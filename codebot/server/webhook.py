@@ -1,15 +1,17 @@
 """GitHub webhook handlers for PR review comments."""
 
-import hashlib
 import hmac
 import os
+import re
 from pathlib import Path
-from queue import Queue
+from queue import Empty, SimpleQueue
+from typing import Callable, Dict, List, Optional
 
 from datetime import datetime
 
 from flask import current_app, request, jsonify
 
+from codebot.core.models import ReviewEvent
 from codebot.core.task_store import global_task_store
 from codebot.core.utils import (
     cleanup_pr_workspace,
@@ -19,66 +21,156 @@ from codebot.core.utils import (
 )
 
 
-# Global FIFO queue for review comments
-review_queue: Queue = Queue()
+# Global FIFO queue of ReviewEvents
+review_queue: SimpleQueue = SimpleQueue()
 
+# Largest webhook body accepted; PR and comment payloads are far below this
+MAX_PAYLOAD_BYTES = 1024 * 1024
 
-def verify_signature(payload: bytes, signature: str, secret: str) -> bool:
+# X-Hub-Signature-256 value: "sha256=" followed by the lowercase hex digest GitHub sends
+_SIGNATURE_RE = re.compile(r"sha256=([0-9a-f]{64})")
+
+# GITHUB_WEBHOOK_SECRET, encoded once rather than read from the environment per request
+_SECRET_BYTES: Optional[bytes] = None
+
+
+def _reload_secret() -> None:
+    """Re-read GITHUB_WEBHOOK_SECRET from the environment."""
+    global _SECRET_BYTES
+    secret = os.getenv("GITHUB_WEBHOOK_SECRET")
+    _SECRET_BYTES = secret.encode() if secret else None
+
+
+_reload_secret()
+
+
+def drain_batch(queue: SimpleQueue, max_n: int = 32, timeout: float = 0.1) -> List[ReviewEvent]:
+    """
+    Take up to max_n events off a review queue in one wakeup.
+    
+    Blocks only for the first event; the rest are whatever is already queued.
+    
+    Args:
+        queue: Review queue to drain (normally review_queue)
+        max_n: Maximum number of events to return
+        timeout: Seconds to wait for the first event before raising queue.Empty
+        
+    Returns:
+        Events in FIFO order, at least one
+    """
+    batch = [queue.get(timeout=timeout)]
+    while len(batch) < max_n:
+        try:
+            batch.append(queue.get_nowait())
+        except Empty:
+            break
+    return batch
+
+
+def verify_signature(payload: bytes, signature: str, secret_bytes: bytes) -> bool:
     """
     Verify GitHub webhook signature.
     
     Args:
         payload: Request payload bytes
         signature: X-Hub-Signature-256 header value
-        secret: Webhook secret
+        secret_bytes: Webhook secret, UTF-8 encoded
         
     Returns:
         True if signature is valid
     """
-    if not signature or not secret:
+    if not signature or not secret_bytes:
         return False
     
-    if not signature.startswith("sha256="):
+    # Prefix, length and charset are checked in one pass, before any hashing
+    match = _SIGNATURE_RE.fullmatch(signature)
+    if match is None:
         return False
     
-    expected_signature = signature[7:]
+    expected_signature = bytes.fromhex(match.group(1))
     
-    mac = hmac.new(secret.encode(), payload, hashlib.sha256)
-    computed_signature = mac.hexdigest()
+    computed_signature = hmac.digest(secret_bytes, payload, "sha256")
     
     return hmac.compare_digest(computed_signature, expected_signature)
 
 
+def _extract_repo(repository: dict) -> tuple:
+    """
+    Pull the fields the review processor needs out of a webhook repository object.
+    
+    Args:
+        repository: "repository" object from the webhook payload
+        
+    Returns:
+        Tuple of (clone_url, owner_login, name)
+    """
+    owner = repository.get("owner") or {}
+    return repository.get("clone_url"), owner.get("login"), repository.get("name")
+
+
+def _extract_pr_basics(pull_request: dict) -> tuple:
+    """
+    Pull the fields the review processor needs out of a webhook pull_request object.
+    
+    Args:
+        pull_request: "pull_request" object from the webhook payload
+        
+    Returns:
+        Tuple of (number, title, body, head_ref)
+    """
+    head = pull_request.get("head") or {}
+    return (
+        pull_request.get("number"),
+        pull_request.get("title"),
+        pull_request.get("body") or "",
+        head.get("ref"),
+    )
+
+
 def handle_webhook():
-    """Handle incoming GitHub webhook events."""
-    webhook_secret = os.getenv("GITHUB_WEBHOOK_SECRET")
+    """
+    Handle incoming GitHub webhook events.
     
-    if not webhook_secret:
+    Event types without a handler are acknowledged with a 200 before the body is
+    read or the signature checked. That response has no side effects, so an
+    unsigned request can learn nothing from it beyond which events are ignored;
+    every event that can queue work or touch a workspace is still verified.
+    """
+    if _SECRET_BYTES is None:
         current_app.logger.error("GITHUB_WEBHOOK_SECRET not set")
         return jsonify({"error": "Webhook secret not configured"}), 500
     
+    event_type = request.headers.get("X-GitHub-Event", "")
+    handler = _EVENT_DISPATCH.get(event_type)
+    if handler is None:
+        current_app.logger.info("Ignoring event type: %s", event_type)
+        return jsonify({"message": "Event type not handled"}), 200
+    
+    # Refuse oversized bodies before spending a hash pass on them
+    content_length = request.content_length
+    if content_length is None:
+        return jsonify({"error": "Content-Length required"}), 411
+    if content_length > MAX_PAYLOAD_BYTES:
+        current_app.logger.warning("Rejecting %s-byte webhook payload", content_length)
+        return jsonify({"error": "Payload too large"}), 413
+    
+    # Read the body once: the verified bytes are parsed directly rather than via request.json
+    body = request.get_data(cache=False)
+    
     signature = request.headers.get("X-Hub-Signature-256", "")
-    if not verify_signature(request.data, signature, webhook_secret):
+    if not verify_signature(body, signature, _SECRET_BYTES):
         current_app.logger.warning("Invalid webhook signature")
         return jsonify({"error": "Invalid signature"}), 401
     
-    event_type = request.headers.get("X-GitHub-Event", "")
-    payload = request.json
+    try:
+        payload = current_app.json.loads(body)
+    except ValueError:
+        return jsonify({"error": "Invalid payload"}), 400
     
     if not payload:
         return jsonify({"error": "Invalid payload"}), 400
     
-    if event_type == "pull_request_review_comment":
-        return handle_review_comment(payload)
-    elif event_type == "pull_request_review":
-        return handle_review(payload)
-    elif event_type == "issue_comment":
-        return handle_issue_comment(payload)
-    elif event_type == "pull_request":
-        return handle_pull_request(payload)
-    else:
-        current_app.logger.info(f"Ignoring event type: {event_type}")
-        return jsonify({"message": "Event type not handled"}), 200
+    return handler(payload)
 
 
 def handle_review_comment(payload: dict) -> tuple:
@@ -96,42 +188,40 @@ def handle_review_comment(payload: dict) -> tuple:
     if action != "created":
         return jsonify({"message": f"Ignoring action: {action}"}), 200
     
-    comment = payload.get("comment", {})
-    comment_body = comment.get("body", "")
+    comment = payload.get("comment") or {}
     
     # Check if comment is from codebot by checking user login
-    comment_user = comment.get("user", {})
-    comment_user_login = comment_user.get("login", "")
+    comment_user_login = (comment.get("user") or {}).get("login") or ""
     bot_login = current_app.config.get("CODEBOT_BOT_LOGIN", "codebot-007[bot]")
     
     if comment_user_login == bot_login:
-        current_app.logger.info(f"Ignoring codebot's own comment (detected by user login: {comment_user_login})")
+        current_app.logger.info("Ignoring codebot's own comment (detected by user login: %s)", comment_user_login)
         return jsonify({"message": "Ignoring codebot's own comment"}), 200
     
-    pull_request = payload.get("pull_request", {})
-    repository = payload.get("repository", {})
-    
-    comment_data = {
-        "type": "review_comment",
-        "comment_id": comment.get("id"),
-        "comment_body": comment.get("body", ""),
-        "pr_number": pull_request.get("number"),
-        "pr_title": pull_request.get("title"),
-        "pr_body": pull_request.get("body", ""),
-        "branch_name": pull_request.get("head", {}).get("ref"),
-        "repo_url": repository.get("clone_url"),
-        "repo_owner": repository.get("owner", {}).get("login"),
-        "repo_name": repository.get("name"),
-        "comment_path": comment.get("path"),
-        "comment_line": comment.get("line"),
-        "comment_diff_hunk": comment.get("diff_hunk", ""),
-        "comment_position": comment.get("position"),
-        "in_reply_to_id": comment.get("in_reply_to_id"),
-    }
-    
-    review_queue.put(comment_data)
-    
-    current_app.logger.info(f"Queued review comment for PR #{comment_data['pr_number']}")
+    pr_number, pr_title, pr_body, branch_name = _extract_pr_basics(payload.get("pull_request") or {})
+    repo_url, repo_owner, repo_name = _extract_repo(payload.get("repository") or {})
+    
+    event = ReviewEvent(
+        type="review_comment",
+        comment_id=comment.get("id"),
+        comment_body=comment.get("body") or "",
+        pr_number=pr_number,
+        pr_title=pr_title,
+        pr_body=pr_body,
+        branch_name=branch_name,
+        repo_url=repo_url,
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        comment_path=comment.get("path"),
+        comment_line=comment.get("line"),
+        comment_diff_hunk=comment.get("diff_hunk") or "",
+        comment_position=comment.get("position"),
+        in_reply_to_id=comment.get("in_reply_to_id"),
+    )
+    
+    review_queue.put(event)
+    
+    current_app.logger.info("Queued review comment for PR #%s", event.pr_number)
     
     return jsonify({"message": "Comment queued for processing"}), 200
 
@@ -151,40 +241,39 @@ def handle_review(payload: dict) -> tuple:
     if action != "submitted":
         return jsonify({"message": f"Ignoring action: {action}"}), 200
     
-    review = payload.get("review", {})
+    review = payload.get("review") or {}
     review_body = review.get("body") or ""
     
-    review_user = review.get("user", {})
-    review_user_login = review_user.get("login", "")
+    review_user_login = (review.get("user") or {}).get("login") or ""
     bot_login = current_app.config.get("CODEBOT_BOT_LOGIN", "codebot-007[bot]")
     
     if review_user_login == bot_login:
-        current_app.logger.info(f"Ignoring codebot's own review (detected by user login: {review_user_login})")
+        current_app.logger.info("Ignoring codebot's own review (detected by user login: %s)", review_user_login)
         return jsonify({"message": "Ignoring codebot's own review"}), 200
     
-    pull_request = payload.get("pull_request", {})
-    repository = payload.get("repository", {})
-    
     if not review_body.strip():
         return jsonify({"message": "Review has no body, skipping"}), 200
     
-    comment_data = {
-        "type": "review",
-        "comment_id": review.get("id"),
-        "comment_body": review_body,
-        "pr_number": pull_request.get("number"),
-        "pr_title": pull_request.get("title"),
-        "pr_body": pull_request.get("body", ""),
-        "branch_name": pull_request.get("head", {}).get("ref"),
-        "repo_url": repository.get("clone_url"),
-        "repo_owner": repository.get("owner", {}).get("login"),
-        "repo_name": repository.get("name"),
-        "review_state": review.get("state"),
-    }
+    pr_number, pr_title, pr_body, branch_name = _extract_pr_basics(payload.get("pull_request") or {})
+    repo_url, repo_owner, repo_name = _extract_repo(payload.get("repository") or {})
+    
+    event = ReviewEvent(
+        type="review",
+        comment_id=review.get("id"),
+        comment_body=review_body,
+        pr_number=pr_number,
+        pr_title=pr_title,
+        pr_body=pr_body,
+        branch_name=branch_name,
+        repo_url=repo_url,
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+        review_state=review.get("state"),
+    )
     
-    review_queue.put(comment_data)
+    review_queue.put(event)
     
-    current_app.logger.info(f"Queued review for PR #{comment_data['pr_number']}")
+    current_app.logger.info("Queued review for PR #%s", event.pr_number)
     
     return jsonify({"message": "Review queued for processing"}), 200
 
@@ -207,43 +296,41 @@ def handle_issue_comment(payload: dict) -> tuple:
     if action != "created":
         return jsonify({"message": f"Ignoring action: {action}"}), 200
     
-    issue = payload.get("issue", {})
+    issue = payload.get("issue") or {}
     if not issue.get("pull_request"):
         current_app.logger.info("Ignoring non-PR issue comment")
         return jsonify({"message": "Not a PR comment"}), 200
     
-    comment = payload.get("comment", {})
-    comment_body = comment.get("body", "")
+    comment = payload.get("comment") or {}
     
     # Check if comment is from codebot by checking user login
-    comment_user = comment.get("user", {})
-    comment_user_login = comment_user.get("login", "")
+    comment_user_login = (comment.get("user") or {}).get("login") or ""
     bot_login = current_app.config.get("CODEBOT_BOT_LOGIN", "codebot-007[bot]")
     
     if comment_user_login == bot_login:
-        current_app.logger.info(f"Ignoring codebot's own comment (detected by user login: {comment_user_login})")
+        current_app.logger.info("Ignoring codebot's own comment (detected by user login: %s)", comment_user_login)
         return jsonify({"message": "Ignoring codebot's own comment"}), 200
     
-    repository = payload.get("repository", {})
-    
-    pr_number = issue.get("number")
+    # The issue object stands in for the PR; its head branch is looked up by the processor
+    pr_number, pr_title, pr_body, _ = _extract_pr_basics(issue)
+    repo_url, repo_owner, repo_name = _extract_repo(payload.get("repository") or {})
     
-    comment_data = {
-        "type": "issue_comment",
-        "comment_id": comment.get("id"),
-        "comment_body": comment.get("body", ""),
-        "pr_number": pr_number,
-        "pr_title": issue.get("title"),
-        "pr_body": issue.get("body", ""),
-        "branch_name": None,
-        "repo_url": repository.get("clone_url"),
-        "repo_owner": repository.get("owner", {}).get("login"),
-        "repo_name": repository.get("name"),
-    }
+    event = ReviewEvent(
+        type="issue_comment",
+        comment_id=comment.get("id"),
+        comment_body=comment.get("body") or "",
+        pr_number=pr_number,
+        pr_title=pr_title,
+        pr_body=pr_body,
+        branch_name=None,
+        repo_url=repo_url,
+        repo_owner=repo_owner,
+        repo_name=repo_name,
+    )
     
-    review_queue.put(comment_data)
+    review_queue.put(event)
     
-    current_app.logger.info(f"Queued issue comment for PR #{comment_data['pr_number']}")
+    current_app.logger.info("Queued issue comment for PR #%s", event.pr_number)
     
     return jsonify({"message": "Comment queued for processing"}), 200
 
@@ -264,16 +351,16 @@ def handle_pull_request(payload: dict) -> tuple:
     if action not in ["closed", "reopened"]:
         return jsonify({"message": f"Ignoring action: {action}"}), 200
     
-    pull_request = payload.get("pull_request", {})
-    branch_name = pull_request.get("head", {}).get("ref", "")
+    pull_request = payload.get("pull_request") or {}
+    branch_name = (pull_request.get("head") or {}).get("ref") or ""
     
     if not branch_name.startswith("u/codebot/"):
-        current_app.logger.info(f"Ignoring non-codebot branch: {branch_name}")
+        current_app.logger.info("Ignoring non-codebot branch: %s", branch_name)
         return jsonify({"message": "Not a codebot branch"}), 200
     
     uuid = extract_uuid_from_branch(branch_name)
     if not uuid:
-        current_app.logger.warning(f"Could not extract UUID from branch: {branch_name}")
+        current_app.logger.warning("Could not extract UUID from branch: %s", branch_name)
         return jsonify({"message": "Could not extract UUID from branch"}), 200
     
     workspace_base_dir_str = current_app.config.get("CODEBOT_WORKSPACE_BASE_DIR")
@@ -285,7 +372,7 @@ def handle_pull_request(payload: dict) -> tuple:
     
     workspace_path = find_workspace_by_uuid(workspace_base_dir, uuid)
     if not workspace_path:
-        current_app.logger.info(f"No workspace found for UUID: {uuid}")
+        current_app.logger.info("No workspace found for UUID: %s", uuid)
         return jsonify({"message": "Workspace not found"}), 200
     
     pr_number = pull_request.get("number")
@@ -297,7 +384,7 @@ def handle_pull_request(payload: dict) -> tuple:
     
     if action == "reopened":
         if task:
-            current_app.logger.info(f"PR #{pr_number} reopened, updating task {task.id} back to pending_review")
+            current_app.logger.info("PR #%s reopened, updating task %s back to pending_review", pr_number, task.id)
             global_task_store.update_task(
                 task.id,
                 status="pending_review",
@@ -317,9 +404,9 @@ def handle_pull_request(payload: dict) -> tuple:
     
     if task:
         if merged:
-            current_app.logger.info(f"PR #{pr_number} merged, task {task.id} updated to completed")
+            current_app.logger.info("PR #%s merged, task %s updated to completed", pr_number, task.id)
         else:
-            current_app.logger.info(f"PR #{pr_number} closed (not merged), task {task.id} updated to rejected")
+            current_app.logger.info("PR #%s closed (not merged), task %s updated to rejected", pr_number, task.id)
     
     if success:
         current_app.logger.info(message)
@@ -329,4 +416,10 @@ def handle_pull_request(payload: dict) -> tuple:
         return jsonify({"message": message}), 500
 
 
-
+# X-GitHub-Event header value -> handler
+_EVENT_DISPATCH: Dict[str, Callable[[dict], tuple]] = {
+    "pull_request_review_comment": handle_review_comment,
+    "pull_request_review": handle_review,
+    "issue_comment": handle_issue_comment,
+    "pull_request": handle_pull_request,
+}
@@ -0,0 +1,27 @@
+"""Test the top-level CLI group."""
+
+import pytest
+from click.testing import CliRunner
+
+from codebot.cli import cli
+
+
+@pytest.mark.parametrize("name", sorted(cli.lazy_short_help))
+def test_lazy_short_help_matches_command(name):
+    """Test that the group's help text for a lazy command is the command's own short help."""
+    command = cli.get_command(None, name)
+    
+    assert cli.lazy_short_help[name] == command.get_short_help_str(limit=1000)
+
+
+def test_group_help_lists_command_short_help():
+    """Test that `codebot --help` shows each command's own short help."""
+    result = CliRunner().invoke(cli, ["--help"], terminal_width=200)
+    
+    assert result.exit_code == 0
+    for name in cli.lazy_short_help:
+        short_help = cli.get_command(None, name).get_short_help_str(limit=1000)
+        assert any(
+            line.split() == [name, *short_help.split()]
+            for line in result.output.splitlines()
+        )
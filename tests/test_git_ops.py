@@ -0,0 +1,150 @@
+"""Test GitOps against a real repository."""
+
+import subprocess
+
+import pytest
+
+from codebot.core import utils
+from codebot.core.git_ops import GitOps
+
+
+def _git(repo, *args):
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """Create a repository on main with one commit, isolated from the user's git config."""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/dev/null")
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    utils._base_git_env.cache_clear()
+    
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.name", "Test")
+    _git(path, "config", "user.email", "test@example.com")
+    (path / "README.md").write_text("hello\n")
+    _git(path, "add", "README.md")
+    _git(path, "commit", "-q", "-m", "Initial commit")
+    
+    yield path
+    utils._base_git_env.cache_clear()
+
+
+@pytest.fixture
+def git_ops(repo):
+    """GitOps for the repository, with its cat-file process stopped afterwards."""
+    ops = GitOps(repo)
+    yield ops
+    ops.close()
+
+
+def test_head_from_loose_ref(repo, git_ops):
+    """Test reading the current branch and HEAD commit from a loose ref."""
+    assert (repo / ".git" / "refs" / "heads" / "main").exists()
+    assert git_ops.get_current_branch() == "main"
+    assert git_ops.get_latest_commit_hash() == _git(repo, "rev-parse", "HEAD")
+
+
+def test_head_from_packed_ref(repo, git_ops):
+    """Test resolving a ref that exists only in packed-refs."""
+    _git(repo, "pack-refs", "--all")
+    
+    assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+    assert git_ops._resolve_ref("refs/heads/main") == _git(repo, "rev-parse", "HEAD")
+    assert git_ops._resolve_ref("refs/heads/missing") is None
+    assert git_ops.get_current_branch() == "main"
+    assert git_ops.get_latest_commit_hash() == _git(repo, "rev-parse", "HEAD")
+
+
+def test_detached_head(repo, git_ops):
+    """Test that a detached HEAD reports HEAD as the branch and its commit as latest."""
+    _git(repo, "checkout", "-q", "--detach")
+    
+    assert git_ops.get_current_branch() == "HEAD"
+    assert git_ops.get_latest_commit_hash() == _git(repo, "rev-parse", "HEAD")
+
+
+def test_unborn_branch(tmp_path, monkeypatch):
+    """Test that a repository without commits has a branch but no latest commit."""
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/dev/null")
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    utils._base_git_env.cache_clear()
+    _git(tmp_path, "init", "-q", "-b", "main")
+    ops = GitOps(tmp_path)
+    
+    try:
+        assert ops.get_current_branch() == "main"
+        assert ops.get_latest_commit_hash() is None
+    finally:
+        ops.close()
+        utils._base_git_env.cache_clear()
+
+
+def test_read_missing_object(repo, git_ops):
+    """Test that a missing object reads as None and leaves the cat-file process usable."""
+    assert git_ops._read_object("0" * 40) is None
+    with pytest.raises(RuntimeError, match="not found"):
+        git_ops.get_commit_message("0" * 40)
+    
+    assert git_ops.get_commit_message(_git(repo, "rev-parse", "HEAD")) == "Initial commit"
+
+
+def test_commit_changes_clean_tree(repo, git_ops):
+    """Test that a clean tree makes no commit."""
+    head = _git(repo, "rev-parse", "HEAD")
+    
+    git_ops.commit_changes("Nothing here")
+    
+    assert _git(repo, "rev-parse", "HEAD") == head
+
+
+def test_commit_changes_tracked(repo, git_ops):
+    """Test committing a change to a tracked file."""
+    (repo / "README.md").write_text("changed\n")
+    
+    git_ops.commit_changes("Change README")
+    
+    assert _git(repo, "log", "-1", "--pretty=%s") == "Change README"
+    assert _git(repo, "status", "--porcelain") == ""
+
+
+def test_commit_changes_untracked(repo, git_ops):
+    """Test that untracked files are picked up along with tracked changes."""
+    (repo / "README.md").write_text("changed\n")
+    (repo / "new.txt").write_text("new\n")
+    
+    git_ops.commit_changes("Add new file")
+    
+    assert _git(repo, "log", "-1", "--pretty=%s") == "Add new file"
+    assert "new.txt" in _git(repo, "ls-files").splitlines()
+    assert _git(repo, "status", "--porcelain") == ""
+
+
+def test_remove_co_author_trailers(repo, git_ops):
+    """Test that Co-Authored-By trailers and the generated marker are dropped from HEAD."""
+    (repo / "README.md").write_text("changed\n")
+    git_ops.commit_changes(
+        "Change README\n\n"
+        "🤖 Generated with Claude Code\n\n"
+        "Co-Authored-By: Someone <someone@example.com>\n"
+    )
+    
+    git_ops.remove_co_author_trailers()
+    
+    assert _git(repo, "log", "-1", "--pretty=%B") == "Change README"
+    assert git_ops.get_commit_message("HEAD") == "Change README"
+
+
+def test_detect_default_branch_from_origin_head(repo, git_ops):
+    """Test reading the default branch from the origin/HEAD symbolic ref."""
+    _git(repo, "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/trunk")
+    
+    assert git_ops.detect_default_branch() == "trunk"
+
+
+def test_detect_default_branch_without_origin(git_ops):
+    """Test falling back to main when there is no origin to ask."""
+    assert git_ops.detect_default_branch() == "main"
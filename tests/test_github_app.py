@@ -0,0 +1,31 @@
+"""Test the GitHub API session helper."""
+
+import threading
+
+from codebot.core.github_app import get_github_session
+
+
+def test_session_is_reused_within_a_thread():
+    """Test that repeated calls on one thread return the same session."""
+    assert get_github_session() is get_github_session()
+
+
+def test_threads_get_own_sessions_sharing_one_adapter():
+    """Test that each thread gets its own session and only the pooled adapter is shared."""
+    sessions = []
+    barrier = threading.Barrier(4)
+    
+    def worker():
+        barrier.wait()
+        sessions.append(get_github_session())
+    
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len({id(session) for session in sessions}) == 4
+    adapters = {id(session.get_adapter("https://api.github.com")) for session in sessions}
+    assert len(adapters) == 1
+    assert sessions[0].headers["User-Agent"] == "codebot"
@@ -0,0 +1,30 @@
+"""Test that the orjson provider writes what Flask's default provider writes."""
+
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+pytest.importorskip("orjson")
+
+from codebot.server.json_provider import OrjsonProvider
+
+
+@pytest.fixture
+def providers():
+    """Return Flask's default provider and the orjson provider for the same app."""
+    app = Flask(__name__)
+    return DefaultJSONProvider(app), OrjsonProvider(app)
+
+
+@pytest.mark.parametrize("obj", [
+    {"b": 1, "a": [True, None, "x"]},
+    {"submitted_at": datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)},
+    {"id": 2 ** 70},
+])
+def test_compact_dumps_matches_default_provider(providers, obj):
+    """Test jsonify-style compact output for sorted keys, datetimes and wide integers."""
+    default, fast = providers
+    
+    assert fast.dumps(obj, separators=(",", ":")) == default.dumps(obj, separators=(",", ":"))
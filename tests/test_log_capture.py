@@ -0,0 +1,163 @@
+"""Test the in-memory log buffers, their persistence and LogStreamWriter."""
+
+import io
+import threading
+
+from codebot.server.log_capture import MAX_PARTIAL_LINE, LogStorage, LogStreamWriter
+
+
+class FakeStorage:
+    """Storage stub that records log writes and can fail a number of them."""
+    
+    def __init__(self, lock=None, failures=0):
+        self.lock = lock
+        self.failures = failures
+        self.calls = 0
+        self.written = {}
+    
+    def update_task_logs_batch(self, entries):
+        self.calls += 1
+        if self.lock is not None:
+            assert self.lock.locked()
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database is locked")
+        self.written.update(entries)
+
+
+def _log_storage(storage, storage_lock=None):
+    log_storage = LogStorage(storage=storage, storage_lock=storage_lock)
+    log_storage.persist_flush_interval = 0.01
+    return log_storage
+
+
+def test_persist_writes_under_storage_lock():
+    """Test that the background writer holds the shared storage lock."""
+    lock = threading.Lock()
+    storage = FakeStorage(lock=lock)
+    log_storage = _log_storage(storage, storage_lock=lock)
+    
+    log_storage.add_log("task-1", "codebot", "hello")
+    log_storage.persist_logs("task-1")
+    log_storage.flush()
+    
+    assert storage.written["task-1"][0]["message"] == "hello"
+    assert not log_storage.has_logs("task-1")
+
+
+def test_persist_retries_a_failed_write():
+    """Test that a transient write failure is retried."""
+    storage = FakeStorage(failures=1)
+    log_storage = _log_storage(storage)
+    
+    log_storage.add_log("task-1", "codebot", "hello")
+    log_storage.persist_logs("task-1")
+    log_storage.flush()
+    
+    assert storage.calls == 2
+    assert "task-1" in storage.written
+    assert not log_storage.has_logs("task-1")
+
+
+def test_persist_drops_a_batch_that_keeps_failing(capsys):
+    """Test that a batch failing every attempt is dropped from memory and reported."""
+    storage = FakeStorage(failures=10)
+    log_storage = _log_storage(storage)
+    
+    log_storage.add_log("task-1", "codebot", "hello")
+    log_storage.persist_logs("task-1")
+    log_storage.flush()
+    
+    assert storage.calls == log_storage.persist_attempts
+    assert storage.written == {}
+    assert not log_storage.has_logs("task-1")
+    assert "Dropping logs of task(s) task-1" in capsys.readouterr().out
+
+
+def _messages(entries):
+    return [(entry["source"], entry["message"]) for entry in entries]
+
+
+def test_overflow_by_lines_keeps_newest_with_marker():
+    """Test that lines over max_log_lines evict the oldest and are counted in a marker line."""
+    log_storage = LogStorage(max_log_lines=3)
+    for index in range(5):
+        log_storage.add_log("task-1", "codebot", f"line {index}")
+    
+    assert _messages(log_storage.get_logs("task-1")) == [
+        ("codebot", "[2 earlier log lines truncated]"),
+        ("codebot", "line 2"),
+        ("codebot", "line 3"),
+        ("codebot", "line 4"),
+    ]
+
+
+def test_overflow_by_bytes_keeps_newest_with_marker():
+    """Test that lines over max_log_bytes_per_task evict the oldest, always keeping the newest."""
+    log_storage = LogStorage(max_log_bytes_per_task=10)
+    for message in ("aaaa", "bbbb", "cccc"):
+        log_storage.add_log("task-1", "codebot", message)
+    
+    assert _messages(log_storage.get_logs("task-1")) == [
+        ("codebot", "[1 earlier log lines truncated]"),
+        ("codebot", "bbbb"),
+        ("codebot", "cccc"),
+    ]
+    
+    log_storage.add_log("task-1", "codebot", "x" * 20)
+    
+    assert _messages(log_storage.get_logs("task-1")) == [
+        ("codebot", "[3 earlier log lines truncated]"),
+        ("codebot", "x" * 20),
+    ]
+
+
+def test_filtered_reads_show_marker_only_for_codebot():
+    """Test that the truncation marker is returned with unfiltered and codebot-only reads."""
+    log_storage = LogStorage(max_log_lines=3)
+    for source, message in (("codebot", "start"), ("claude", "one"), ("codebot", "step"), ("claude", "two")):
+        log_storage.add_log("task-1", source, message)
+    
+    marker = ("codebot", "[1 earlier log lines truncated]")
+    assert _messages(log_storage.get_logs("task-1")) == [marker, ("claude", "one"), ("codebot", "step"), ("claude", "two")]
+    assert _messages(log_storage.get_logs("task-1", source_filter="codebot")) == [marker, ("codebot", "step")]
+    assert _messages(log_storage.get_logs("task-1", source_filter="claude")) == [("claude", "one"), ("claude", "two")]
+
+
+def test_stream_writer_joins_partial_lines():
+    """Test that writes are split on newlines and partial lines are joined."""
+    log_storage = LogStorage()
+    original = io.StringIO()
+    writer = LogStreamWriter(log_storage, "task-1", "claude", original)
+    
+    writer.write("first\nsec")
+    writer.write("ond\n\n   \nthird")
+    writer.flush()
+    
+    assert original.getvalue() == "first\nsecond\n\n   \nthird"
+    assert [entry["message"] for entry in log_storage.get_logs("task-1")] == ["first", "second", "third"]
+
+
+def test_stream_writer_splits_long_partial_line():
+    """Test that an unterminated line longer than MAX_PARTIAL_LINE is logged without waiting for a newline."""
+    log_storage = LogStorage()
+    writer = LogStreamWriter(log_storage, "task-1", "claude", io.StringIO())
+    chunk = "x" * (MAX_PARTIAL_LINE // 2 + 1)
+    
+    writer.write(chunk)
+    assert log_storage.get_logs("task-1") == []
+    writer.write(chunk)
+    writer.write("tail\n")
+    
+    assert [entry["message"] for entry in log_storage.get_logs("task-1")] == [chunk * 2, "tail"]
+
+
+def test_stream_writer_drops_long_whitespace_partial_line():
+    """Test that an unterminated run of whitespace over MAX_PARTIAL_LINE is discarded."""
+    log_storage = LogStorage()
+    writer = LogStreamWriter(log_storage, "task-1", "claude", io.StringIO())
+    
+    writer.write(" " * (MAX_PARTIAL_LINE + 1))
+    writer.write("text\n")
+    
+    assert [entry["message"] for entry in log_storage.get_logs("task-1")] == ["text"]
@@ -0,0 +1,70 @@
+"""Test the cached GitHub App configuration validation."""
+
+import pytest
+
+from codebot.core import utils
+from codebot.core.github_app import GitHubAppAuth
+
+
+@pytest.fixture
+def app_config(tmp_path, monkeypatch):
+    """Point the GitHub App configuration and the validation cache at tmp_path."""
+    key_path = tmp_path / "app.pem"
+    key_path.write_text("private key")
+    monkeypatch.setattr(utils, "_dotenv_loaded", True)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("GITHUB_APP_ID", "1")
+    monkeypatch.setenv("GITHUB_APP_INSTALLATION_ID", "2")
+    monkeypatch.setenv("GITHUB_APP_PRIVATE_KEY_PATH", str(key_path))
+    monkeypatch.setenv("GITHUB_BOT_NAME", "codebot")
+    monkeypatch.setenv("GITHUB_API_URL", "https://api.github.example")
+    
+    calls = []
+    
+    def get_installation_token(self):
+        calls.append(self)
+        return "token-value"
+    
+    monkeypatch.setattr(GitHubAppAuth, "get_installation_token", get_installation_token)
+    return key_path, calls
+
+
+def test_cached_validation_skips_token_request(app_config):
+    """Test that a repeated validation of the same configuration reuses the cached result."""
+    _, calls = app_config
+    
+    assert utils.validate_github_app_config_cached() == (True, None)
+    assert utils.validate_github_app_config_cached() == (True, None)
+    assert len(calls) == 1
+
+
+def test_cached_validation_rechecks_changed_key(app_config):
+    """Test that changing the private key contents invalidates the cached result."""
+    key_path, calls = app_config
+    
+    utils.validate_github_app_config_cached()
+    key_path.write_text("another private key")
+    
+    assert utils.validate_github_app_config_cached() == (True, None)
+    assert len(calls) == 2
+
+
+def test_cached_validation_reports_removed_bot_name(app_config, monkeypatch):
+    """Test that a cached result does not hide a configuration that no longer loads."""
+    utils.validate_github_app_config_cached()
+    monkeypatch.delenv("GITHUB_BOT_NAME")
+    
+    assert utils.validate_github_app_config_cached() == (False, "config_missing")
+
+
+def test_cached_validation_reports_missing_key_file(app_config):
+    """Test that a moved private key is reported even when a validation is cached."""
+    key_path, _ = app_config
+    
+    utils.validate_github_app_config_cached()
+    key_path.unlink()
+    
+    is_valid, error = utils.validate_github_app_config_cached()
+    
+    assert not is_valid
+    assert "private key file not found" in error
@@ -0,0 +1,149 @@
+"""Test signature verification and request checks on the webhook endpoint."""
+
+import hashlib
+import hmac
+import io
+import json
+from queue import Empty
+
+import pytest
+
+from codebot.server import webhook
+from codebot.server.flask_app import create_app
+
+SECRET = b"webhook-secret"
+
+REVIEW_COMMENT = {
+    "action": "created",
+    "comment": {"id": 1, "body": "Please rename this", "user": {"login": "reviewer"}, "path": "app.py", "line": 3},
+    "pull_request": {"number": 5, "title": "Add feature", "head": {"ref": "codebot/feature-abc1234"}},
+    "repository": {"name": "repo", "owner": {"login": "owner"}, "clone_url": "https://github.com/owner/repo.git"},
+}
+
+
+def _sign(body: bytes) -> str:
+    return "sha256=" + hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+
+
+def _drain_review_queue() -> list:
+    events = []
+    while True:
+        try:
+            events.append(webhook.review_queue.get_nowait())
+        except Empty:
+            return events
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client for an app with the webhook endpoint and a known secret."""
+    monkeypatch.setenv("GITHUB_WEBHOOK_SECRET", SECRET.decode())
+    app = create_app(enable_webhook=True)
+    _drain_review_queue()
+    yield app.test_client()
+    _drain_review_queue()
+    monkeypatch.delenv("GITHUB_WEBHOOK_SECRET")
+    webhook._reload_secret()
+
+
+def _post(client, body: bytes, signature=None, event="pull_request_review_comment"):
+    headers = {"X-GitHub-Event": event, "Content-Type": "application/json"}
+    if signature is not None:
+        headers["X-Hub-Signature-256"] = signature
+    return client.post("/webhook", data=body, headers=headers)
+
+
+def test_valid_signature_queues_event(client):
+    """Test that a correctly signed review comment is queued."""
+    body = json.dumps(REVIEW_COMMENT).encode()
+    
+    response = _post(client, body, _sign(body))
+    
+    assert response.status_code == 200
+    events = _drain_review_queue()
+    assert [(event.type, event.pr_number, event.comment_id) for event in events] == [("review_comment", 5, 1)]
+
+
+def test_bad_signature_rejected(client):
+    """Test that a signature made with another secret is rejected."""
+    body = json.dumps(REVIEW_COMMENT).encode()
+    signature = "sha256=" + hmac.new(b"other-secret", body, hashlib.sha256).hexdigest()
+    
+    response = _post(client, body, signature)
+    
+    assert response.status_code == 401
+    assert _drain_review_queue() == []
+
+
+def test_missing_signature_rejected(client):
+    """Test that a handled event without a signature header is rejected."""
+    response = _post(client, json.dumps(REVIEW_COMMENT).encode())
+    
+    assert response.status_code == 401
+    assert _drain_review_queue() == []
+
+
+@pytest.mark.parametrize("malform", [
+    pytest.param(lambda sig: sig.upper().replace("SHA256=", "sha256="), id="uppercase-hex"),
+    pytest.param(lambda sig: sig[:-2], id="too-short"),
+    pytest.param(lambda sig: sig + "00", id="too-long"),
+    pytest.param(lambda sig: sig[len("sha256="):], id="no-prefix"),
+    pytest.param(lambda sig: sig.replace("sha256=", "sha1="), id="wrong-algorithm"),
+    pytest.param(lambda sig: sig[:-1] + "g", id="non-hex"),
+])
+def test_malformed_signature_rejected(client, malform):
+    """Test that a signature header not in GitHub's exact format is rejected."""
+    body = json.dumps(REVIEW_COMMENT).encode()
+    
+    response = _post(client, body, malform(_sign(body)))
+    
+    assert response.status_code == 401
+    assert _drain_review_queue() == []
+
+
+def test_missing_content_length_rejected(client):
+    """Test that a handled event without Content-Length is refused before the body is read."""
+    body = json.dumps(REVIEW_COMMENT).encode()
+    
+    # A chunked request carries no usable Content-Length
+    response = client.post(
+        "/webhook",
+        input_stream=io.BytesIO(body),
+        headers={
+            "X-GitHub-Event": "pull_request_review_comment",
+            "X-Hub-Signature-256": _sign(body),
+            "Content-Type": "application/json",
+            "Transfer-Encoding": "chunked",
+        },
+    )
+    
+    assert response.status_code == 411
+    assert _drain_review_queue() == []
+
+
+def test_oversized_body_rejected(client):
+    """Test that a correctly signed body over MAX_PAYLOAD_BYTES is refused."""
+    body = json.dumps({**REVIEW_COMMENT, "padding": "x" * webhook.MAX_PAYLOAD_BYTES}).encode()
+    
+    response = _post(client, body, _sign(body))
+    
+    assert response.status_code == 413
+    assert _drain_review_queue() == []
+
+
+def test_unhandled_event_acknowledged_without_signature(client):
+    """Test that an event type without a handler gets a 200 without being verified."""
+    response = _post(client, b'{"zen": "Keep it simple."}', event="ping")
+    
+    assert response.status_code == 200
+    assert response.get_json() == {"message": "Event type not handled"}
+    assert _drain_review_queue() == []
+
+
+def test_invalid_json_rejected(client):
+    """Test that a correctly signed body that is not JSON is rejected."""
+    body = b"not json"
+    
+    response = _post(client, body, _sign(body))
+    
+    assert response.status_code == 400